@@ -54,6 +54,7 @@ async def database():
     finally:
         await c.close(timeout=1)
         os.environ["postgres_pool_dsn"] = PG_TEST_DSN
+        _psycopg._reset_environ_cache()
 
 
 @pytest.fixture(scope="package")
@@ -1,5 +1,9 @@
+import inspect
+from unittest import mock
+
 import pytest
 
+from yesql.core import parse
 from yesql.core.drivers.postgresql import _asyncpg
 
 pytestmark = pytest.mark.asyncio
@@ -19,6 +23,18 @@ class TestConnectionTransactionManagement:
         # Then
         assert one == 1
 
+    @staticmethod
+    async def test_checkout(asyncpg_executor: _asyncpg.AsyncPGQueryExecutor):
+        # When
+        # We check out a connection from the pool
+        async with asyncpg_executor.checkout() as c:
+            # Re-use it implicitly (would stall if we tried to fetch again,
+            #   since the pool has only one connection).
+            async with asyncpg_executor.connection() as c2:
+                reused = c2 is c
+        # Then
+        assert reused
+
     @staticmethod
     async def test_transaction(asyncpg_executor: _asyncpg.AsyncPGQueryExecutor):
         # Given
@@ -41,3 +57,45 @@ class TestConnectionTransactionManagement:
         )
         # Then
         assert created == committed and created["bar"] == bar and rolledback is None
+
+
+class TestServerSideCursors:
+    @staticmethod
+    @pytest.mark.parametrize(
+        argnames="transaction", argvalues=[True, False], ids=["transaction", "no-tx"]
+    )
+    async def test_many_fetch_size(
+        asyncpg_executor: _asyncpg.AsyncPGQueryExecutor, transaction: bool
+    ):
+        # When
+        # Fetch in batches smaller than the result set.
+        rows = await asyncpg_executor.many(
+            _SERIES, fetch_size=2, transaction=transaction
+        )
+        # Then
+        assert [r["id"] for r in rows] == _SERIES_IDS
+
+    @staticmethod
+    async def test_many_fetch_size_deserializer(
+        asyncpg_executor: _asyncpg.AsyncPGQueryExecutor,
+    ):
+        # Given
+        deserializer = mock.MagicMock(side_effect=lambda rows: [r["id"] for r in rows])
+        # When
+        ids = await asyncpg_executor.many(
+            _SERIES, fetch_size=2, deserializer=deserializer
+        )
+        # Then
+        # The deserializer is called once, on the combined batches.
+        assert ids == _SERIES_IDS and deserializer.call_count == 1
+
+
+_SERIES_IDS = [1, 2, 3, 4, 5]
+_SERIES = parse.QueryDatum(
+    name="series",
+    doc="",
+    sql="SELECT g AS id FROM generate_series(1, 5) AS g ORDER BY g",
+    signature=inspect.Signature([]),
+    modifier=parse.MANY,
+    remapping=None,
+)
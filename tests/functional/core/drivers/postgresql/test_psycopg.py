@@ -1,6 +1,10 @@
+import inspect
+from unittest import mock
+
 import psycopg
 import pytest
 
+from yesql.core import parse
 from yesql.core.drivers.postgresql import _psycopg
 
 pytestmark = pytest.mark.asyncio
@@ -56,6 +60,20 @@ class TestConnectionTransactionManagement:
         # Then
         assert created == committed and created.bar == bar and rolledback is None
 
+    @staticmethod
+    async def test_async_checkout(
+        async_psycopg_executor: _psycopg.AsyncPsycoPGQueryExecutor,
+    ):
+        # When
+        # We check out a connection from the pool
+        async with async_psycopg_executor.checkout() as c:
+            # Re-use it implicitly (would stall if we tried to fetch again,
+            #   since the pool has only one connection).
+            async with async_psycopg_executor.connection() as c2:
+                reused = c2 is c
+        # Then
+        assert reused
+
     @staticmethod
     def test_sync_connection(sync_psycopg_executor: _psycopg.PsycoPGQueryExecutor):
         # When
@@ -93,3 +111,164 @@ class TestConnectionTransactionManagement:
             rolledback = cursor.fetchone()
         # Then
         assert created == committed and created.bar == bar and rolledback is None
+
+    @staticmethod
+    def test_sync_checkout(sync_psycopg_executor: _psycopg.PsycoPGQueryExecutor):
+        # When
+        # We check out a connection from the pool
+        with sync_psycopg_executor.checkout() as c:
+            # Re-use it implicitly (would stall if we tried to fetch again,
+            #   since the pool has only one connection).
+            with sync_psycopg_executor.connection() as c2:
+                reused = c2 is c
+        # Then
+        assert reused
+
+
+class TestServerSideCursors:
+    @staticmethod
+    @pytest.mark.parametrize(
+        argnames="transaction", argvalues=[True, False], ids=["transaction", "no-tx"]
+    )
+    async def test_async_many_fetch_size(
+        async_psycopg_executor: _psycopg.AsyncPsycoPGQueryExecutor,
+        transaction: bool,
+    ):
+        # When
+        # Fetch in batches smaller than the result set.
+        rows = await async_psycopg_executor.many(
+            _SERIES, fetch_size=2, transaction=transaction
+        )
+        # Then
+        assert [r.id for r in rows] == _SERIES_IDS
+
+    @staticmethod
+    async def test_async_many_fetch_size_deserializer(
+        async_psycopg_executor: _psycopg.AsyncPsycoPGQueryExecutor,
+    ):
+        # Given
+        deserializer = mock.MagicMock(side_effect=lambda rows: [r.id for r in rows])
+        # When
+        ids = await async_psycopg_executor.many(
+            _SERIES, fetch_size=2, deserializer=deserializer
+        )
+        # Then
+        # The deserializer is called once, on the combined batches.
+        assert ids == _SERIES_IDS and deserializer.call_count == 1
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        argnames="transaction", argvalues=[True, False], ids=["transaction", "no-tx"]
+    )
+    def test_sync_many_fetch_size(
+        sync_psycopg_executor: _psycopg.PsycoPGQueryExecutor, transaction: bool
+    ):
+        # When
+        # Fetch in batches smaller than the result set.
+        rows = sync_psycopg_executor.many(
+            _SERIES, fetch_size=2, transaction=transaction
+        )
+        # Then
+        assert [r.id for r in rows] == _SERIES_IDS
+
+    @staticmethod
+    def test_sync_many_fetch_size_deserializer(
+        sync_psycopg_executor: _psycopg.PsycoPGQueryExecutor,
+    ):
+        # Given
+        deserializer = mock.MagicMock(side_effect=lambda rows: [r.id for r in rows])
+        # When
+        ids = sync_psycopg_executor.many(
+            _SERIES, fetch_size=2, deserializer=deserializer
+        )
+        # Then
+        # The deserializer is called once, on the combined batches.
+        assert ids == _SERIES_IDS and deserializer.call_count == 1
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        argnames="transaction", argvalues=[True, False], ids=["transaction", "no-tx"]
+    )
+    async def test_async_many_cursor_stream(
+        async_psycopg_executor: _psycopg.AsyncPsycoPGQueryExecutor,
+        transaction: bool,
+    ):
+        # When
+        # Iterate across more than one batch.
+        async with async_psycopg_executor.many_cursor(
+            _SERIES, stream=True, itersize=2, transaction=transaction
+        ) as cursor:
+            ids = [r.id async for r in cursor]
+        # Then
+        assert isinstance(cursor, psycopg.AsyncServerCursor)
+        assert ids == _SERIES_IDS
+
+    @staticmethod
+    async def test_async_many_cursor_stream_checkout(
+        async_psycopg_executor: _psycopg.AsyncPsycoPGQueryExecutor,
+    ):
+        # When
+        # Open two server-side cursors at once on the same connection.
+        async with async_psycopg_executor.checkout() as c:
+            async with async_psycopg_executor.many_cursor(
+                _SERIES, stream=True, itersize=2
+            ) as first:
+                async with async_psycopg_executor.many_cursor(
+                    _SERIES, stream=True, itersize=2
+                ) as second:
+                    head = [r.id for r in await first.fetchmany(2)]
+                    second_ids = [r.id async for r in second]
+                    first_ids = head + [r.id async for r in first]
+        # Then
+        assert first.connection is c and second.connection is c
+        assert first.name != second.name
+        assert first_ids == second_ids == _SERIES_IDS
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        argnames="transaction", argvalues=[True, False], ids=["transaction", "no-tx"]
+    )
+    def test_sync_many_cursor_stream(
+        sync_psycopg_executor: _psycopg.PsycoPGQueryExecutor, transaction: bool
+    ):
+        # When
+        # Iterate across more than one batch.
+        with sync_psycopg_executor.many_cursor(
+            _SERIES, stream=True, itersize=2, transaction=transaction
+        ) as cursor:
+            ids = [r.id for r in cursor]
+        # Then
+        assert isinstance(cursor, psycopg.ServerCursor)
+        assert ids == _SERIES_IDS
+
+    @staticmethod
+    def test_sync_many_cursor_stream_checkout(
+        sync_psycopg_executor: _psycopg.PsycoPGQueryExecutor,
+    ):
+        # When
+        # Open two server-side cursors at once on the same connection.
+        with sync_psycopg_executor.checkout() as c:
+            with sync_psycopg_executor.many_cursor(
+                _SERIES, stream=True, itersize=2
+            ) as first:
+                with sync_psycopg_executor.many_cursor(
+                    _SERIES, stream=True, itersize=2
+                ) as second:
+                    head = [r.id for r in first.fetchmany(2)]
+                    second_ids = [r.id for r in second]
+                    first_ids = head + [r.id for r in first]
+        # Then
+        assert first.connection is c and second.connection is c
+        assert first.name != second.name
+        assert first_ids == second_ids == _SERIES_IDS
+
+
+_SERIES_IDS = [1, 2, 3, 4, 5]
+_SERIES = parse.QueryDatum(
+    name="series",
+    doc="",
+    sql="SELECT g AS id FROM generate_series(1, 5) AS g ORDER BY g",
+    signature=inspect.Signature([]),
+    modifier=parse.MANY,
+    remapping=None,
+)
@@ -77,3 +77,14 @@ async def test_select_scalar(queries, session):
     )
     # Then
     assert id == created.id
+
+
+async def test_execute_batch(queries, session):
+    # Given
+    titles = [f"Batched {i}" for i in range(5)]
+    query = "INSERT INTO blog.posts (title) VALUES ($1)"
+    # When
+    await queries.execute_batch(query, [(t,) for t in titles], connection=session)
+    found = await queries.select("title", connection=session, coerce=False)
+    # Then
+    assert set(titles) <= {r["title"] for r in found}
@@ -80,3 +80,14 @@ def test_select_scalar(queries, session):
     )
     # Then
     assert id == created.id
+
+
+def test_execute_batch(queries, session):
+    # Given
+    titles = [f"Batched {i}" for i in range(5)]
+    query = "INSERT INTO blog.posts (title) VALUES (%s)"
+    # When
+    queries.execute_batch(query, [(t,) for t in titles], connection=session)
+    found = queries.select("title", connection=session, coerce=False)
+    # Then
+    assert set(titles) <= {r["title"] for r in found}
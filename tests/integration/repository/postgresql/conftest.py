@@ -5,6 +5,7 @@ import asyncpg
 import pytest
 
 from examples.pg import db
+from yesql.core.drivers.postgresql import _psycopg
 from tests.integration.repository.postgresql import factories
 
 
@@ -12,7 +13,9 @@ from tests.integration.repository.postgresql import factories
 def dsn() -> str:
     dsn = "postgres://postgres:@localhost:5432/test?sslmode=disable"
     with mock.patch.dict(os.environ, database_url=dsn):
+        _psycopg._reset_environ_cache()
         yield dsn
+    _psycopg._reset_environ_cache()
 
 
 @pytest.fixture(scope="package", autouse=True)
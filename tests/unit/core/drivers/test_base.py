@@ -0,0 +1,69 @@
+import asyncio
+import contextvars
+import threading
+from unittest import mock
+
+import pytest
+
+from yesql.core.drivers import base
+
+
+@pytest.fixture
+def executor_factory():
+    with mock.patch.object(base.BaseQueryExecutor, "__abstractmethods__", set()):
+        yield base.BaseQueryExecutor
+
+
+def test_checkout_nested_executors(executor_factory):
+    # Given
+    a, b = executor_factory(), executor_factory()
+    token_a = a._set_checkout("conn-a")
+    # When
+    token_b = b._set_checkout("conn-b")
+    nested = (a._get_checkout(), b._get_checkout())
+    b._reset_checkout(token_b)
+    outer = (a._get_checkout(), b._get_checkout())
+    a._reset_checkout(token_a)
+    # Then
+    assert nested == ("conn-a", "conn-b")
+    assert outer == ("conn-a", None)
+    assert a._get_checkout() is None
+
+
+async def test_checkout_not_shared_with_child_tasks(executor_factory):
+    # Given
+    executor = executor_factory()
+
+    async def get_checkout():
+        return executor._get_checkout()
+
+    token = executor._set_checkout("conn")
+    # When
+    try:
+        children = await asyncio.gather(get_checkout(), get_checkout())
+        parent = executor._get_checkout()
+    finally:
+        executor._reset_checkout(token)
+    # Then
+    assert children == [None, None]
+    assert parent == "conn"
+
+
+def test_checkout_not_shared_with_other_threads(executor_factory):
+    # Given
+    executor = executor_factory()
+    token = executor._set_checkout("conn")
+    result = []
+    # When
+    try:
+        # Run in a copy of this context, as `asyncio.to_thread` does.
+        ctx = contextvars.copy_context()
+        thread = threading.Thread(
+            target=ctx.run, args=(lambda: result.append(executor._get_checkout()),)
+        )
+        thread.start()
+        thread.join()
+    finally:
+        executor._reset_checkout(token)
+    # Then
+    assert result == [None]
@@ -29,6 +29,22 @@ def test__clean_comment(comment: str, expected: str):
     assert cleaned == expected
 
 
+@pytest.mark.parametrize(
+    argnames="comment,expected",
+    argvalues=[
+        ("/** foo **/", ["foo"]),
+        ("/**\n * foo\n * bar\n **/", ["* foo", "* bar"]),
+        ("/** path/to/foo/ **/", ["path/to/foo/"]),
+    ],
+    ids=["single-line", "multi-line", "inner-slashes"],
+)
+def test__split_comments(comment: str, expected: list[str]):
+    # When
+    split = parse._split_comments(comment)
+    # Then
+    assert split == expected
+
+
 @pytest.mark.parametrize(
     argnames="token,expected_posargs,expected_kwdargs",
     argvalues=[
@@ -62,6 +78,17 @@ def test__clean_comment(comment: str, expected: str):
             {"$1": inspect.Parameter("arg1", inspect.Parameter.POSITIONAL_ONLY)},
             {},
         ),
+        (
+            sql.TokenList(
+                [
+                    sql.Token(tokens.Name.Placeholder, ":foo"),
+                    sql.Token(tokens.Whitespace, " "),
+                    sql.Token(tokens.Name.Placeholder, ":foo"),
+                ]
+            ),
+            {},
+            {":foo": inspect.Parameter("foo", inspect.Parameter.KEYWORD_ONLY)},
+        ),
     ],
     ids=[
         "colon-name",
@@ -70,6 +97,7 @@ def test__clean_comment(comment: str, expected: str):
         "pyfmt",
         "pyfmt-digit",
         "dollar-digit",
+        "repeated-name",
     ],
 )
 def test__gather_parameters(
@@ -118,12 +146,24 @@ def test__gather_parameters(
             "select %(foo)s",
             None,
         ),
+        (
+            "select :foobar, :foo::text",
+            "psycopg",
+            {},
+            {
+                ":foobar": inspect.Parameter("foobar", inspect.Parameter.KEYWORD_ONLY),
+                ":foo": inspect.Parameter("foo", inspect.Parameter.KEYWORD_ONLY),
+            },
+            "select %(foobar)s, %(foo)s::text",
+            None,
+        ),
     ],
     ids=[
         "asyncpg-named",
         "asyncpg-digit",
         "asyncpg-named-digit-mixed",
         "psycopg-named",
+        "psycopg-named-shared-prefix",
     ],
 )
 def test__normalize_parameters(
@@ -463,3 +503,14 @@ def test_parse(
     package = parse.parse(queries, driver=driver, modname=modname)
     # Then
     assert package == expected_package
+
+
+def test_reset_parse_cache():
+    # Given
+    sql = "-- :name foo :^\nselect * from foo limit 1;"
+    parse.parse(sql, driver="asyncpg", modname="foo")
+    # When
+    parse._reset_parse_cache()
+    # Then
+    assert parse.parse.cache_info().currsize == 0
+    assert parse._parse_text.cache_info().currsize == 0
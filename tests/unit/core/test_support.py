@@ -1,6 +1,8 @@
 import dataclasses
+import datetime
 import inspect
-from typing import Any, NamedTuple
+import uuid
+from typing import Any, AsyncIterator, Awaitable, NamedTuple
 from unittest import mock
 
 import pytest
@@ -154,6 +156,36 @@ class TestRetryCursor:
         with pytest.raises(DummyError):
             await self._exhaust_mock(wrapped, svc)
 
+    @staticmethod
+    @pytest.mark.parametrize(argnames="isasync", argvalues=[True, False])
+    async def test_retry_cursor_reenter(isasync):
+        # Given
+        def func(svc, query):
+            cursor = mock.MagicMock()
+            target = cursor.__aenter__ if isasync else cursor.__enter__
+            target.return_value = (svc, query)
+            return cursor
+
+        a, b = DummyExecutor(), DummyExecutor()
+        with mock.patch("yesql.core.support._isasync", return_value=isasync):
+            wrapped = yesql.support.retry_cursor(func)
+        cm = wrapped(a, "qa")
+        await TestRetryCursor._exhaust_context(cm)
+        # When
+        other = wrapped(b, "qb")
+        result = await TestRetryCursor._exhaust_context(cm)
+        # Then
+        assert other is not cm
+        assert result == (a, "qa")
+
+    @staticmethod
+    async def _exhaust_context(ctx):
+        if hasattr(ctx, "__aenter__"):
+            async with ctx as result:
+                return result
+        with ctx as result:
+            return result
+
     @staticmethod
     async def _exhaust_mock(m, s):
         called = m(s)
@@ -162,3 +194,140 @@ class TestRetryCursor:
                 return result
         with m(s) as result:
             return result
+
+
+@pytest.mark.parametrize(
+    argnames="decorator",
+    argvalues=[yesql.support.retry, yesql.support.retry_cursor],
+    ids=["retry", "retry_cursor"],
+)
+async def test_retry_copies_meta(decorator):
+    # Given
+    def func(self):
+        """Doc."""
+
+    # When
+    wrapped = decorator(func)
+    # Then
+    assert (wrapped.__name__, wrapped.__qualname__, wrapped.__doc__) == (
+        func.__name__,
+        func.__qualname__,
+        func.__doc__,
+    )
+    assert inspect.unwrap(wrapped) is func
+
+
+async def _coroutine():
+    ...
+
+
+def _sync() -> int:
+    ...
+
+
+def _awaitable() -> Awaitable[int]:
+    ...
+
+
+def _async_iterator() -> AsyncIterator[int]:
+    ...
+
+
+@pytest.mark.parametrize(
+    argnames="func,expected",
+    argvalues=[
+        (_coroutine, True),
+        (_sync, False),
+        (_awaitable, True),
+        (_async_iterator, True),
+    ],
+    ids=["coroutine", "sync", "awaitable", "async-iterator"],
+)
+async def test_resolve_isasync(func, expected):
+    # When
+    isasync = yesql.support._resolve_isasync(func)
+    # Then
+    assert isasync is expected
+
+
+async def test_isasync_cached():
+    # Given
+    async def func():
+        ...
+
+    # When
+    with mock.patch(
+        "yesql.core.support._resolve_isasync", return_value=True
+    ) as resolve:
+        first = yesql.support._isasync(func)
+        second = yesql.support._isasync(func)
+    # Then
+    assert first and second and resolve.call_count == 1
+
+
+@pytest.mark.parametrize(
+    argnames="tries,jitter,expected",
+    argvalues=[
+        (0, True, 0),
+        (1, False, 0.1),
+        (3, False, 0.4),
+        (10, False, 1.0),
+    ],
+    ids=["yield", "first", "exponential", "capped"],
+)
+async def test_backoff(tries: int, jitter: bool, expected: float):
+    # When
+    backoff = yesql.support._backoff(tries, 0.1, 1.0, jitter)
+    # Then
+    assert backoff == pytest.approx(expected)
+
+
+async def test_backoff_jitter():
+    # When
+    backoff = yesql.support._backoff(2, 0.1, 1.0, True)
+    # Then
+    assert 0 <= backoff <= 0.2
+
+
+@pytest.mark.parametrize(
+    argnames="o,expected",
+    argvalues=[
+        ({"bar": 1}, '{"bar":1}'),
+        ({1: "bar"}, '{"1":"bar"}'),
+        ([Foo(bar=1)], '[{"bar":1}]'),
+        (Foo(bar=1), '{"bar":1}'),
+        ({"bar": {1, 2}}, '{"bar":[1,2]}'),
+        ((1, 2), "[1,2]"),
+        (datetime.date(2020, 1, 1), '"2020-01-01"'),
+        (uuid.UUID(int=1), '"00000000-0000-0000-0000-000000000001"'),
+    ],
+    ids=[
+        "dict",
+        "non-str-keys",
+        "nested-dataclass",
+        "dataclass",
+        "nested-set",
+        "tuple",
+        "date",
+        "uuid",
+    ],
+)
+async def test_dumps(o: Any, expected: str):
+    # When
+    dumped = yesql.support.dumps(o)
+    dumpedb = yesql.support.dumpsb(o)
+    # Then
+    assert dumped == expected and dumpedb == expected.encode()
+
+
+@pytest.mark.parametrize(
+    argnames="delay,expected",
+    argvalues=[(0.0001, 0), (0.01, 0.01)],
+    ids=["sub-millisecond", "timer"],
+)
+async def test_asleep(delay: float, expected: float):
+    # When
+    with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock) as sleep:
+        await yesql.support._asleep(delay)
+    # Then
+    sleep.assert_awaited_once_with(expected)
@@ -139,6 +139,7 @@ def test_process_sql():
     given_token = _mock_token(
         __str__=lambda _: given_sql,
         tokens=[_mock_token(flatten=lambda: given_sub_tokens)],
+        flatten=lambda: sqlparse.parse(given_sql)[0].flatten(),
     )
     expected_sig = inspect.Signature(
         [
@@ -473,3 +474,23 @@ def test_parse_package():
     package = parse.parse(queries=package_path, driver="asyncpg")
     # Then
     assert package == expected_package
+
+
+def test_parse_package_workers():
+    # Given
+    package_path = QUERIES / "foo"
+    expected_package = parse.parse(queries=package_path, driver="psycopg")
+    # When
+    package = parse.parse(queries=package_path, driver="psycopg", workers=2)
+    # Then
+    assert package == expected_package
+
+
+def test_parse_module_no_named_queries():
+    # Given
+    queries = "create table foo (id int);\nselect * from foo;"
+    # When
+    with mock.patch.object(parse, "_parse_text", spec_set=True) as parse_text:
+        module = parse.parse_module(queries=queries, modname="foo", driver="asyncpg")
+    # Then
+    assert module.queries == {} and not parse_text.called
@@ -0,0 +1,237 @@
+import dataclasses
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+import yesql
+from tests.unit.queries import QUERIES
+
+
+@dataclasses.dataclass
+class Foo:
+    bar: str
+
+
+def test_iter_middlewares():
+    # Given
+    class FooRepository(yesql.SyncQueryRepository[Foo]):
+        model = Foo
+
+        class metadata(yesql.QueryMetadata):
+            __querylib__ = QUERIES
+
+        @yesql.middleware("get")
+        def intercept_get(statement, *args, **kwargs):
+            ...
+
+    # When
+    middlewares = [*FooRepository._iter_middlewares()]
+    # Then
+    assert middlewares == [("intercept_get", FooRepository.intercept_get)]
+    assert FooRepository.get.middleware is FooRepository.intercept_get
+
+
+def test_iter_middlewares_override():
+    # Given
+    class FooRepository(yesql.SyncQueryRepository[Foo]):
+        model = Foo
+
+        class metadata(yesql.QueryMetadata):
+            __querylib__ = QUERIES
+
+        @yesql.middleware("get")
+        def intercept_get(statement, *args, **kwargs):
+            ...
+
+    class BarRepository(FooRepository):
+        def intercept_get(self):
+            ...
+
+    # When
+    middlewares = [*BarRepository._iter_middlewares()]
+    # Then
+    assert middlewares == []
+
+
+def test_get_middleware_map_per_class():
+    # Given
+    class FooRepository(yesql.SyncQueryRepository[Foo]):
+        model = Foo
+
+        class metadata(yesql.QueryMetadata):
+            __querylib__ = QUERIES
+
+    class BarRepository(FooRepository):
+        @yesql.middleware("get")
+        def intercept_get(statement, *args, **kwargs):
+            ...
+
+    # When
+    foo_map = FooRepository._get_middleware_map()
+    bar_map = BarRepository._get_middleware_map()
+    # Then
+    assert foo_map == {}
+    assert bar_map == {"get": BarRepository.intercept_get}
+    assert BarRepository._get_middleware_map() is bar_map
+
+
+def test_statements_resolved_lazily():
+    # Given
+    with mock.patch.object(
+        yesql.repository.parse, "parse", wraps=yesql.repository.parse.parse
+    ) as parse:
+
+        class FooRepository(yesql.SyncQueryRepository[Foo]):
+            model = Foo
+
+            class metadata(yesql.QueryMetadata):
+                __querylib__ = QUERIES
+
+        # When
+        called_on_definition = parse.called
+        statement = FooRepository().get
+        # Then
+        assert not called_on_definition
+        assert parse.call_count == 1
+        assert statement.query.name == "get"
+        assert FooRepository.bar.get
+
+
+def test_statements_resolved_per_subclass():
+    # Given
+    class FooRepository(yesql.SyncQueryRepository[Foo]):
+        model = Foo
+
+        class metadata(yesql.QueryMetadata):
+            __querylib__ = QUERIES
+
+    FooRepository.__statements__
+
+    class BarRepository(FooRepository):
+        ...
+
+    # When
+    statements = BarRepository.__statements__
+    # Then
+    assert statements is not FooRepository.__statements__
+    assert "__statements__" in BarRepository.__dict__
+
+
+def test_missing_attribute():
+    # Given
+    class FooRepository(yesql.SyncQueryRepository[Foo]):
+        model = Foo
+
+        class metadata(yesql.QueryMetadata):
+            __querylib__ = QUERIES
+
+    # When/Then
+    with pytest.raises(AttributeError):
+        FooRepository().nope
+
+
+def test_count_datum_cached():
+    # Given
+    class FooRepository(yesql.SyncQueryRepository[Foo]):
+        model = Foo
+
+        class metadata(yesql.QueryMetadata):
+            __querylib__ = QUERIES
+
+    datum = FooRepository.get.query
+    # When
+    first = yesql.repository._get_count_datum(datum)
+    second = yesql.repository._get_count_datum(datum)
+    # Then
+    assert first is second
+    assert first.sql == f"SELECT count(*) FROM ({datum.sql.rstrip(';')}) AS q;"
+
+
+@dataclasses.dataclass
+class Bar:
+    id: int
+    bar: str
+    baz: int = 0
+
+
+@pytest.mark.parametrize(
+    argnames="model_cls,instance,expected",
+    argvalues=[
+        (Bar, Bar(1, "bar"), {"bar": "bar", "baz": 0}),
+        (Foo, Foo("foo"), {"bar": "foo"}),
+    ],
+    ids=["many-fields", "one-field"],
+)
+def test_get_kvs(model_cls, instance, expected):
+    # Given
+    class BarRepository(yesql.SyncQueryRepository):
+        model = model_cls
+
+        class metadata(yesql.QueryMetadata):
+            __querylib__ = QUERIES
+            __tablename__ = "foo"
+
+    # When
+    kvs = BarRepository.get_kvs(instance)
+    # Then
+    assert kvs == expected
+
+
+def test_resolve_statements_custom_impl():
+    # Given
+    class FooRepository(yesql.SyncQueryRepository[Foo]):
+        model = Foo
+
+        class metadata(yesql.QueryMetadata):
+            __querylib__ = QUERIES
+
+        def get(self):
+            ...
+
+    # When
+    FooRepository.__statements__
+    # Then
+    assert isinstance(FooRepository.get_default, yesql.Statement)
+    assert not isinstance(FooRepository.__dict__["get"], yesql.Statement)
+
+
+def test_statements_resolved_once_across_threads():
+    # Given
+    class FooRepository(yesql.SyncQueryRepository[Foo]):
+        model = Foo
+
+        class metadata(yesql.QueryMetadata):
+            __querylib__ = QUERIES
+
+    parse = yesql.repository.parse.parse
+    barrier = threading.Barrier(2)
+
+    def slow_parse(*args, **kwargs):
+        # Hold the first thread in resolution while the second looks up `get`.
+        time.sleep(0.05)
+        return parse(*args, **kwargs)
+
+    results: list = []
+
+    def get():
+        barrier.wait()
+        try:
+            results.append(FooRepository.get)
+        except AttributeError as e:
+            results.append(e)
+
+    # When
+    with mock.patch.object(
+        yesql.repository.parse, "parse", side_effect=slow_parse
+    ) as parsed:
+        threads = [threading.Thread(target=get) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    # Then
+    assert parsed.call_count == 1
+    assert results[0] is results[1]
+    assert isinstance(results[0], yesql.Statement)
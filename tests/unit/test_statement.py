@@ -87,6 +87,45 @@ class TestCoreStatement:
         # Then
         assert stmt.__call__ == stmt.execute and stmt._middleware is None
 
+    @staticmethod
+    @pytest.mark.parametrize(
+        argnames="unit_cls,attr",
+        argvalues=[
+            (statement.One, "deserializer"),
+            (statement.Many, "bulk_deserializer"),
+        ],
+        ids=["one", "many"],
+    )
+    def test_serdes_setter(unit_cls, attr, datum, executor):
+        # Given
+        unit = unit_cls(query=datum, executor=executor)
+        serdes = statement.SerDes(
+            serializer=mock.MagicMock(),
+            deserializer=mock.MagicMock(),
+            bulk_deserializer=mock.MagicMock(),
+        )
+        # When
+        unit.serdes = serdes
+        # Then
+        assert unit._deserializer is getattr(serdes, attr)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        argnames="unit_cls,attr",
+        argvalues=[
+            (statement.One, "one"),
+            (statement.ManyCursor, "many_cursor"),
+        ],
+        ids=["one", "many_cursor"],
+    )
+    def test_executor_setter(unit_cls, attr, datum, executor):
+        # Given
+        unit = unit_cls(query=datum)
+        # When
+        unit.executor = executor
+        # Then
+        assert unit._exec is getattr(executor, attr)
+
     @pytest.mark.parametrize(
         argnames="instance,serializer,expected_args,expected_kwargs",
         argvalues=[
@@ -129,6 +168,23 @@ class TestCoreStatement:
         assert params == expected_params
 
 
+@pytest.mark.parametrize(
+    argnames="unit_cls",
+    argvalues=[
+        cls
+        for classes in statement._MODIFIER_TO_STATEMENTS.values()
+        for cls in classes
+        if cls is not None
+    ],
+    ids=lambda cls: cls.__name__,
+)
+def test_statement_slotted(unit_cls, datum, executor):
+    # When
+    unit = unit_cls(query=datum, executor=executor)
+    # Then
+    assert not hasattr(unit, "__dict__")
+
+
 def test_statement_execute(statement_case):
     # Given
     unit, kwargs, exec_method, expected_call = statement_case
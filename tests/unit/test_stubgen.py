@@ -0,0 +1,63 @@
+import textwrap
+
+import pytest
+
+import yesql
+from yesql import stubgen
+
+SOURCE = textwrap.dedent(
+    '''
+    import dataclasses
+
+
+    @dataclasses.dataclass
+    class Foo:
+        bar: str
+
+
+    def func():
+        class Local:
+            ...
+
+
+    class Outer:
+        """Outer."""
+
+        class Inner:
+            ...
+
+        # trailing comment
+    '''
+)
+
+
+@pytest.mark.parametrize(
+    argnames="qualname,expected",
+    argvalues=[
+        ("Foo", "@dataclasses.dataclass\nclass Foo:\n    bar: str\n"),
+        ("func.<locals>.Local", "    class Local:\n        ...\n"),
+        ("Outer.Inner", "    class Inner:\n        ...\n"),
+        (
+            "Outer",
+            'class Outer:\n    """Outer."""\n\n    class Inner:\n        ...\n\n'
+            "    # trailing comment\n",
+        ),
+    ],
+    ids=["decorated", "local", "nested", "outer"],
+)
+def test_get_class_sources(qualname, expected):
+    # When
+    sources = stubgen.get_class_sources(SOURCE)
+    # Then
+    assert sources[qualname] == expected
+
+
+def test_get_execute_params_cached():
+    # Given
+    execute = yesql.statement.Many.execute
+    # When
+    first = stubgen.get_execute_params(execute)
+    second = stubgen.get_execute_params(execute)
+    # Then
+    assert first is second
+    assert "self" not in first and "instance" in first
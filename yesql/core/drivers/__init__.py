@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from types import ModuleType
 from typing import Literal, NamedTuple
 
 from yesql.core.drivers import postgresql
@@ -25,7 +26,9 @@ def get_driver(
         )
     if (dialect, aio) not in _DIALECT_AIO_TO_EXECUTOR:
         raise RuntimeError(f"{dialect!r} is not implemented for {aio=}.")
-    executor = _DIALECT_AIO_TO_EXECUTOR[(dialect, aio)]
+    # Resolving the executor imports its SDK on first use.
+    module, name = _DIALECT_AIO_TO_EXECUTOR[(dialect, aio)]
+    executor = getattr(module, name)
     if executor is NotImplemented:
         drivers = _DIALECT_AIO_TO_DRIVERS[(dialect, aio)]
         raise RuntimeError(f"Required driver(s) {' or '.join(drivers)} not installed.")
@@ -40,10 +43,10 @@ SupportedDialectsT = Literal["postgresql"]
 SupportedDriversT = Literal["asyncpg", "psycopg"]
 
 _SUPPORTED_DIALECTS: set[SupportedDialectsT] = {"postgresql"}
-_DIALECT_AIO_TO_EXECUTOR: dict[tuple[SupportedDialectsT, bool], type[BaseQueryExecutor]]
+_DIALECT_AIO_TO_EXECUTOR: dict[tuple[SupportedDialectsT, bool], tuple[ModuleType, str]]
 _DIALECT_AIO_TO_EXECUTOR = {
-    ("postgresql", True): postgresql.AsyncQueryExecutor,
-    ("postgresql", False): postgresql.SyncQueryExecutor,
+    ("postgresql", True): (postgresql, "AsyncQueryExecutor"),
+    ("postgresql", False): (postgresql, "SyncQueryExecutor"),
 }
 _DIALECT_AIO_TO_DRIVERS: dict[
     tuple[SupportedDialectsT, bool], tuple[SupportedDriversT, ...]
@@ -1,7 +1,22 @@
 from __future__ import annotations
 
 import abc
-from typing import Any, Generic, Iterable, Mapping, Sequence, TypeVar, Union
+import asyncio
+import contextvars
+import functools
+import threading
+import types as pytypes
+from typing import (
+    Any,
+    Generic,
+    Hashable,
+    Iterable,
+    Mapping,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from yesql.core import parse, types
 
@@ -38,6 +53,34 @@ class BaseQueryExecutor(abc.ABC, Generic[_CT]):
     def connection(self, *, timeout: float = 10, connection: _CT | None = None):
         ...
 
+    @abc.abstractmethod
+    def checkout(self, *, timeout: float = 10):
+        """Check out a connection to be re-used by all queries within this context.
+
+        Checkouts are tracked per executor, so checkouts on different executors may
+        be nested. A checkout only applies to the task (or thread) which opened it:
+        tasks spawned within the context (e.g., with `asyncio.gather`) inherit the
+        context, but not the connection, and will acquire their own from the pool.
+        """
+        ...
+
+    def _get_checkout(self) -> _CT | None:
+        checkout = _CHECKOUT.get().get(self)
+        # A connection can't run concurrent operations, so ignore a checkout
+        #   inherited by any other task or thread.
+        if checkout is not None and checkout[1] == _checkout_owner():
+            return checkout[0]
+        return None
+
+    def _set_checkout(self, connection: _CT) -> contextvars.Token:
+        # Copy on set, so that resetting the token restores any outer checkouts.
+        checkouts = {**_CHECKOUT.get(), self: (connection, _checkout_owner())}
+        return _CHECKOUT.set(checkouts)
+
+    @staticmethod
+    def _reset_checkout(token: contextvars.Token):
+        _CHECKOUT.reset(token)
+
     @abc.abstractmethod
     def transaction(
         self,
@@ -193,6 +236,7 @@ class BaseQueryExecutor(abc.ABC, Generic[_CT]):
         ...
 
     @classmethod
+    @functools.lru_cache(maxsize=16)
     def get_explain_command(cls, analyze: bool = False, format: str = None) -> str:
         options = (
             f"{'ANALYZE, ' if analyze else ''}"
@@ -204,3 +248,19 @@ class BaseQueryExecutor(abc.ABC, Generic[_CT]):
         return cls.EXPLAIN_PREFIX
 
     EXPLAIN_PREFIX = "EXPLAIN"
+
+
+def _checkout_owner() -> Hashable:
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        # No running event loop.
+        task = None
+    return task or threading.get_ident()
+
+
+# Checked-out connections by executor, with the task or thread which owns each.
+_CheckoutsT = Mapping[BaseQueryExecutor, Tuple[Any, Hashable]]
+_CHECKOUT: contextvars.ContextVar[_CheckoutsT] = contextvars.ContextVar(
+    "yesql_checkout", default=pytypes.MappingProxyType({})
+)
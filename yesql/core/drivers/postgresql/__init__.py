@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable
+import functools
+import importlib
+from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
     from ._asyncpg import (
@@ -23,33 +25,53 @@ if TYPE_CHECKING:
     )
 
 else:
-    AsyncPGConnectionSettings = NotImplemented
-    AsyncPGPoolSettings = NotImplemented
-    AsyncQueryExecutor = NotImplemented
-    create_async_pool = NotImplemented
-    PsycoPGConnectionSettings = NotImplemented
-    PsycoPGPoolSettings = NotImplemented
-    SyncQueryExecutor = NotImplemented
-    create_sync_pool = NotImplemented
+    # Resolve the executors lazily (PEP 562), so that we only import the SDK(s)
+    #   which are actually used.
 
-    try:
-        from ._asyncpg import AsyncPGConnectionSettings, AsyncPGPoolSettings
-        from ._asyncpg import AsyncPGQueryExecutor as AsyncQueryExecutor
-        from ._asyncpg import create_pool as create_async_pool
-    except (ImportError, ModuleNotFoundError):
-        pass
+    def __getattr__(name: str):
+        if name not in _RESOLVERS:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = globals()[name] = _RESOLVERS[name]()
+        return value
 
-    try:
-        if AsyncQueryExecutor is NotImplemented:
-            from ._psycopg import (
-                AsyncPsycoPGQueryExecutor as AsyncQueryExecutor,
-                create_async_pool,
-            )
-        from ._psycopg import PsycoPGConnectionSettings, PsycoPGPoolSettings
-        from ._psycopg import PsycoPGQueryExecutor as SyncQueryExecutor
-        from ._psycopg import create_sync_pool
-    except (ImportError, ModuleNotFoundError):
-        pass
+    def _resolve(modname: str, name: str):
+        try:
+            module = importlib.import_module(f"{__name__}.{modname}")
+        except (ImportError, ModuleNotFoundError):
+            return NotImplemented
+        return getattr(module, name)
+
+    def _resolve_async(asyncpg_name: str, psycopg_name: str):
+        # Prefer asyncpg for asyncio, falling back to psycopg.
+        resolved = _resolve("_asyncpg", asyncpg_name)
+        if resolved is NotImplemented:
+            resolved = _resolve("_psycopg", psycopg_name)
+        return resolved
+
+    _RESOLVERS: dict[str, Callable[[], Any]] = {
+        "AsyncPGConnectionSettings": functools.partial(
+            _resolve, "_asyncpg", "AsyncPGConnectionSettings"
+        ),
+        "AsyncPGPoolSettings": functools.partial(
+            _resolve, "_asyncpg", "AsyncPGPoolSettings"
+        ),
+        "AsyncQueryExecutor": functools.partial(
+            _resolve_async, "AsyncPGQueryExecutor", "AsyncPsycoPGQueryExecutor"
+        ),
+        "create_async_pool": functools.partial(
+            _resolve_async, "create_pool", "create_async_pool"
+        ),
+        "PsycoPGConnectionSettings": functools.partial(
+            _resolve, "_psycopg", "PsycoPGConnectionSettings"
+        ),
+        "PsycoPGPoolSettings": functools.partial(
+            _resolve, "_psycopg", "PsycoPGPoolSettings"
+        ),
+        "SyncQueryExecutor": functools.partial(
+            _resolve, "_psycopg", "PsycoPGQueryExecutor"
+        ),
+        "create_sync_pool": functools.partial(_resolve, "_psycopg", "create_sync_pool"),
+    }
 
 
 __all__ = (
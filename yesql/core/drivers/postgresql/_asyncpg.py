@@ -85,12 +85,25 @@ class AsyncPGQueryExecutor(base.BaseQueryExecutor):
         self, *, timeout: float = 10, connection: asyncpg.Connection = None
     ) -> AsyncIterator[asyncpg.Connection]:
         await self.initialize()
+        connection = connection or self._get_checkout()
         if connection:
             yield connection
         else:
             async with self.pool.acquire(timeout=timeout) as conn:
                 yield conn
 
+    @contextlib.asynccontextmanager
+    async def checkout(
+        self, *, timeout: float = 10
+    ) -> AsyncIterator[asyncpg.Connection]:
+        conn: asyncpg.Connection
+        async with self.connection(timeout=timeout) as conn:
+            token = self._set_checkout(conn)
+            try:
+                yield conn
+            finally:
+                self._reset_checkout(token)
+
     @contextlib.asynccontextmanager
     async def transaction(  # type: ignore[override]
         self,
@@ -124,10 +137,19 @@ class AsyncPGQueryExecutor(base.BaseQueryExecutor):
         transaction: bool = True,
         rollback: bool = False,
         deserializer: types.DeserializerT[_T] | None = None,
+        fetch_size: int | None = None,
         **kwargs,
     ):
+        """Execute the query and fetch all results.
+
+        By default, the full result set is fetched in a single round-trip.
+        If `fetch_size` is given, a server-side cursor is used instead and rows are
+        fetched in batches of `fetch_size`. A smaller `fetch_size` means more
+        round-trips, but less data buffered by the driver for each. A server-side
+        cursor only lives as long as its transaction, so one is always opened for it.
+        """
         await self.initialize()
-        if transaction:
+        if transaction or fetch_size:
             ctx = self.transaction(
                 timeout=timeout, connection=connection, rollback=rollback
             )
@@ -135,10 +157,16 @@ class AsyncPGQueryExecutor(base.BaseQueryExecutor):
             ctx = self.connection(timeout=timeout, connection=connection)
         c: asyncpg.Connection
         async with ctx as c:
-            results = await c.fetch(
-                query.sql, *self._remap_kwargs(query, args, kwargs), timeout=timeout
-            )
-            if results and deserializer:
+            params = self._remap_kwargs(query, args, kwargs)
+            if fetch_size:
+                cursor = await c.cursor(query.sql, *params, timeout=timeout)
+                results: list = []
+                extend, fetch = results.extend, cursor.fetch
+                while batch := await fetch(fetch_size, timeout=timeout):
+                    extend(batch)
+            else:
+                results = await c.fetch(query.sql, *params, timeout=timeout)
+            if deserializer is not None:
                 return deserializer(results)
             return results
 
@@ -190,7 +218,7 @@ class AsyncPGQueryExecutor(base.BaseQueryExecutor):
             result = await c.fetchrow(
                 query.sql, *self._remap_kwargs(query, args, kwargs), timeout=timeout
             )
-            if result and deserializer:
+            if deserializer is not None:
                 return deserializer(result)
             return result
 
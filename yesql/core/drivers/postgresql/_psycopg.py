@@ -2,10 +2,15 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import dataclasses
+import functools
+import itertools
 import threading
 from typing import (
     Any,
+    AsyncContextManager,
     AsyncIterator,
+    ContextManager,
     Iterable,
     Iterator,
     Mapping,
@@ -55,10 +60,14 @@ class AsyncPsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.AsyncConnection])
         self,
         *,
         pool: pgpool.AsyncConnectionPool = None,
+        eager: bool = True,
         **pool_kwargs,
     ):
         super().__init__(pool=pool, **pool_kwargs)
         self._lock = asyncio.Lock()
+        self._initializing: asyncio.Future | None = None
+        self.eager = eager
+        _init_psycopg()
 
     def __await__(self):
         return self.initialize().__await__()
@@ -73,12 +82,28 @@ class AsyncPsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.AsyncConnection])
     async def initialize(self):
         if self.pool:
             return
+        # Concurrent callers share a single initialization,
+        #   which isn't cancelled if any one of them is.
+        initializing = self._initializing
+        if initializing is None:
+            initializing = self._initializing = asyncio.ensure_future(
+                self._initialize()
+            )
+            initializing.add_done_callback(self._clear_initializing)
+        await asyncio.shield(initializing)
+
+    def _clear_initializing(self, _: asyncio.Future):
+        self._initializing = None
+
+    async def _initialize(self):
         async with self._lock:
             if self.pool:
                 return
             self.pool = create_async_pool(**self.pool_kwargs)
             self.pool.kwargs.setdefault("row_factory", pgrows.namedtuple_row)
-            await self.pool.wait(timeout=self.pool_kwargs.get("timeout", 30))
+            # Wait for the pool to fill, unless connections are opened on-demand.
+            if self.eager and self.pool.min_size > 0:
+                await self.pool.wait(timeout=self.pool_kwargs.get("timeout", 30))
 
     async def teardown(self, *, timeout: int = 10):
         if not self.managed or not self.pool:
@@ -91,33 +116,36 @@ class AsyncPsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.AsyncConnection])
             finally:
                 self.pool = None
 
-    @contextlib.asynccontextmanager
-    async def connection(
+    def connection(
         self, *, timeout: float = 10, connection: psycopg.AsyncConnection = None
+    ) -> AsyncContextManager[psycopg.AsyncConnection]:
+        return AsyncConnectionContext(self, timeout, connection)
+
+    @contextlib.asynccontextmanager
+    async def checkout(
+        self, *, timeout: float = 10
     ) -> AsyncIterator[psycopg.AsyncConnection]:
-        await self.initialize()
-        if connection:
-            yield connection
-        else:
-            async with self.pool.connection(timeout=timeout) as conn:
+        conn: psycopg.AsyncConnection
+        async with self.connection(timeout=timeout) as conn:
+            token = self._set_checkout(conn)
+            try:
                 yield conn
-                await conn.rollback()
+            finally:
+                self._reset_checkout(token)
 
-    @contextlib.asynccontextmanager
-    async def transaction(  # type: ignore[override]
+    def transaction(  # type: ignore[override]
         self,
         *,
         timeout: float = 10,
         connection: psycopg.AsyncConnection = None,
         rollback: bool = False,
         savepoint_name: Optional[str] = None,
-    ) -> AsyncIterator[psycopg.AsyncConnection]:
-        conn: psycopg.AsyncConnection
-        async with self.connection(timeout=timeout, connection=connection) as conn:
-            async with conn.transaction(
-                savepoint_name=savepoint_name, force_rollback=rollback
-            ):
-                yield conn
+    ) -> AsyncContextManager[psycopg.AsyncConnection]:
+        return AsyncTransactionContext(
+            AsyncConnectionContext(self, timeout, connection),
+            rollback,
+            savepoint_name,
+        )
 
     @support.retry
     async def many(
@@ -129,10 +157,19 @@ class AsyncPsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.AsyncConnection])
         transaction: bool = True,
         rollback: bool = False,
         deserializer: types.DeserializerT[_T] | None = None,
+        fetch_size: int | None = None,
         **params,
     ):
+        """Execute the query and fetch all results.
+
+        By default, the full result set is fetched in a single round-trip.
+        If `fetch_size` is given, a server-side cursor is used instead and rows are
+        fetched in batches of `fetch_size`. A smaller `fetch_size` means more
+        round-trips, but less data buffered by the driver for each. A server-side
+        cursor only lives as long as its transaction, so one is always opened for it.
+        """
         await self.initialize()
-        if transaction:
+        if transaction or fetch_size:
             ctx = self.transaction(
                 timeout=timeout, connection=connection, rollback=rollback
             )
@@ -140,13 +177,22 @@ class AsyncPsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.AsyncConnection])
             ctx = self.connection(timeout=timeout, connection=connection)
         c: psycopg.AsyncConnection
         async with ctx as c:
-            async with (
-                await c.execute(query=query.sql, params=args or params)
-            ) as cursor:
-                results = await cursor.fetchall()
-                if results and deserializer:
-                    return deserializer(results)
-                return results
+            if fetch_size:
+                scursor: psycopg.AsyncServerCursor
+                async with c.cursor(name=_cursor_name()) as scursor:
+                    await scursor.execute(query.sql, params=args or params)
+                    results: list = []
+                    extend, fetchmany = results.extend, scursor.fetchmany
+                    while batch := await fetchmany(fetch_size):
+                        extend(batch)
+            else:
+                async with (
+                    await c.execute(query=query.sql, params=args or params)
+                ) as cursor:
+                    results = await cursor.fetchall()
+            if deserializer is not None:
+                return deserializer(results)
+            return results
 
     @support.retry_cursor
     @contextlib.asynccontextmanager
@@ -158,17 +204,35 @@ class AsyncPsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.AsyncConnection])
         timeout: float = 10,
         transaction: bool = True,
         rollback: bool = False,
+        stream: bool = False,
+        itersize: int = 2000,
         **params,
     ) -> AsyncIterator[psycopg.AsyncCursor]:
+        """Execute the query and yield a cursor over the result.
+
+        By default, the full result set is fetched into client memory.
+        If `stream` is true, a server-side cursor is used instead, which will fetch
+        rows from the server in batches of `itersize` as the cursor is iterated.
+        A higher `itersize` means fewer round-trips, but more memory per batch.
+        A server-side cursor only lives as long as its transaction, so one is always
+        opened for it.
+        """
         await self.initialize()
-        if transaction:
+        if transaction or stream:
             ctx = self.transaction(
                 timeout=timeout, connection=connection, rollback=rollback
             )
         else:
             ctx = self.connection(timeout=timeout, connection=connection)
         async with ctx as connection:
-            yield await connection.execute(query=query.sql, params=args or params)
+            if not stream:
+                yield await connection.execute(query=query.sql, params=args or params)
+                return
+            cursor: psycopg.AsyncServerCursor
+            async with connection.cursor(name=_cursor_name()) as cursor:
+                cursor.itersize = itersize
+                await cursor.execute(query.sql, params=args or params)
+                yield cursor
 
     @support.retry
     async def one(
@@ -195,7 +259,7 @@ class AsyncPsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.AsyncConnection])
                 await c.execute(query=query.sql, params=args or params)
             ) as cursor:
                 result = await cursor.fetchone()
-                if result and deserializer:
+                if deserializer is not None:
                     return deserializer(result)
                 return result
 
@@ -223,9 +287,7 @@ class AsyncPsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.AsyncConnection])
                 await c.execute(query=query.sql, params=args or params)
             ) as cursor:
                 val = await cursor.fetchone()
-                if val:
-                    return val[0]
-                return
+                return val[0] if val is not None else None
 
     @support.retry
     async def multi(
@@ -255,14 +317,15 @@ class AsyncPsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.AsyncConnection])
                 if not returns:
                     return cursor.rowcount or cursor.statusmessage
 
-                out: list[_T] = []
+                # Result sets must be drained in order:
+                #   `nextset()` moves the cursor, so fetches can't be gathered.
                 nextset = cursor.nextset
                 fetchall = cursor.fetchall
+                out: list = await fetchall()
                 extend = out.extend
-                extend(await fetchall())
                 while nextset():
                     extend(await fetchall())
-                if out and deserializer:
+                if deserializer is not None:
                     return deserializer(out)
                 return out
 
@@ -337,10 +400,13 @@ class PsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.Connection]):
         self,
         *,
         pool: pgpool.ConnectionPool = None,
+        eager: bool = False,
         **pool_kwargs,
     ):
         super().__init__(pool=pool, **pool_kwargs)
         self._lock = threading.Lock()
+        self.eager = eager
+        _init_psycopg()
 
     def initialize(self):
         if self.pool:
@@ -350,8 +416,10 @@ class PsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.Connection]):
                 return
             self.pool = create_sync_pool(**self.pool_kwargs)
             self.pool.kwargs.setdefault("row_factory", pgrows.namedtuple_row)
-            # FIXME: Sporadically times out if we try to eagerly wait for pool to fill.
-            # self.pool.wait()
+            # Wait for the pool to fill, unless connections are opened on-demand.
+            #   This is opt-in, since it may sporadically time out.
+            if self.eager and self.pool.min_size > 0:
+                self.pool.wait(timeout=self.pool_kwargs.get("timeout", 30))
 
     def teardown(self, *, timeout: int = 10):
         if not self.managed or not self.pool:
@@ -364,19 +432,21 @@ class PsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.Connection]):
             finally:
                 self.pool = None
 
-    @contextlib.contextmanager
     def connection(
         self, *, timeout: float = 10, connection: psycopg.Connection = None
-    ) -> Iterator[psycopg.Connection]:
-        self.initialize()
-        if connection:
-            yield connection
-        else:
-            with self.pool.connection(timeout=timeout) as conn:
-                yield conn
-                conn.rollback()
+    ) -> ContextManager[psycopg.Connection]:
+        return ConnectionContext(self, timeout, connection)
 
     @contextlib.contextmanager
+    def checkout(self, *, timeout: float = 10) -> Iterator[psycopg.Connection]:
+        conn: psycopg.Connection
+        with self.connection(timeout=timeout) as conn:
+            token = self._set_checkout(conn)
+            try:
+                yield conn
+            finally:
+                self._reset_checkout(token)
+
     def transaction(
         self,
         *,
@@ -385,13 +455,12 @@ class PsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.Connection]):
         rollback: bool = False,
         savepoint_name: Optional[str] = None,
         **_,
-    ) -> Iterator[psycopg.Connection]:
-        conn: psycopg.Connection
-        with self.connection(timeout=timeout, connection=connection) as conn:
-            with conn.transaction(
-                savepoint_name=savepoint_name, force_rollback=rollback
-            ):
-                yield conn
+    ) -> ContextManager[psycopg.Connection]:
+        return TransactionContext(
+            ConnectionContext(self, timeout, connection),
+            rollback,
+            savepoint_name,
+        )
 
     @support.retry
     def many(
@@ -403,10 +472,19 @@ class PsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.Connection]):
         transaction: bool = True,
         rollback: bool = False,
         deserializer: types.DeserializerT[_T] | None = None,
+        fetch_size: int | None = None,
         **params,
     ):
+        """Execute the query and fetch all results.
+
+        By default, the full result set is fetched in a single round-trip.
+        If `fetch_size` is given, a server-side cursor is used instead and rows are
+        fetched in batches of `fetch_size`. A smaller `fetch_size` means more
+        round-trips, but less data buffered by the driver for each. A server-side
+        cursor only lives as long as its transaction, so one is always opened for it.
+        """
         self.initialize()
-        if transaction:
+        if transaction or fetch_size:
             ctx = self.transaction(
                 timeout=timeout, connection=connection, rollback=rollback
             )
@@ -414,11 +492,20 @@ class PsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.Connection]):
             ctx = self.connection(timeout=timeout, connection=connection)
         c: psycopg.Connection
         with ctx as c:
-            with c.execute(query=query.sql, params=args or params) as cursor:
-                results = cursor.fetchall()
-                if results and deserializer:
-                    return deserializer(results)
-                return results
+            if fetch_size:
+                scursor: psycopg.ServerCursor
+                with c.cursor(name=_cursor_name()) as scursor:
+                    scursor.execute(query.sql, params=args or params)
+                    results: list = []
+                    extend, fetchmany = results.extend, scursor.fetchmany
+                    while batch := fetchmany(fetch_size):
+                        extend(batch)
+            else:
+                with c.execute(query=query.sql, params=args or params) as cursor:
+                    results = cursor.fetchall()
+            if deserializer is not None:
+                return deserializer(results)
+            return results
 
     @support.retry_cursor
     @contextlib.contextmanager
@@ -430,17 +517,35 @@ class PsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.Connection]):
         timeout: float = 10,
         transaction: bool = True,
         rollback: bool = False,
+        stream: bool = False,
+        itersize: int = 2000,
         **params,
     ) -> Iterator[psycopg.Cursor]:
+        """Execute the query and yield a cursor over the result.
+
+        By default, the full result set is fetched into client memory.
+        If `stream` is true, a server-side cursor is used instead, which will fetch
+        rows from the server in batches of `itersize` as the cursor is iterated.
+        A higher `itersize` means fewer round-trips, but more memory per batch.
+        A server-side cursor only lives as long as its transaction, so one is always
+        opened for it.
+        """
         self.initialize()
-        if transaction:
+        if transaction or stream:
             ctx = self.transaction(
                 timeout=timeout, connection=connection, rollback=rollback
             )
         else:
             ctx = self.connection(timeout=timeout, connection=connection)
         with ctx as connection:
-            yield connection.execute(query=query.sql, params=args or params)
+            if not stream:
+                yield connection.execute(query=query.sql, params=args or params)
+                return
+            cursor: psycopg.ServerCursor
+            with connection.cursor(name=_cursor_name()) as cursor:
+                cursor.itersize = itersize
+                cursor.execute(query.sql, params=args or params)
+                yield cursor
 
     @support.retry
     def one(
@@ -465,7 +570,7 @@ class PsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.Connection]):
         with ctx as c:
             with c.execute(query=query.sql, params=args or params) as cursor:
                 result = cursor.fetchone()
-                if result and deserializer:
+                if deserializer is not None:
                     return deserializer(result)
                 return result
 
@@ -491,9 +596,7 @@ class PsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.Connection]):
         with ctx as c:
             with c.execute(query=query.sql, params=args or params) as cursor:
                 val = cursor.fetchone()
-                if val:
-                    return val[0]
-                return
+                return val[0] if val is not None else None
 
     @support.retry
     def multi(
@@ -530,7 +633,7 @@ class PsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.Connection]):
                 extend(fetchall())
                 while nextset():
                     extend(fetchall())
-                if out and deserializer:
+                if deserializer is not None:
                     return deserializer(out)
                 return out
 
@@ -586,6 +689,158 @@ class PsycoPGQueryExecutor(base.BaseQueryExecutor[psycopg.Connection]):
                 return cursor.rowcount
 
 
+class AsyncConnectionContext:
+    """Acquire a connection from the executor's pool, unless one is provided.
+
+    This is hand-written rather than built with `contextlib`, since it is entered
+    for every query.
+    """
+
+    __slots__ = ("executor", "timeout", "connection", "_ctx")
+
+    def __init__(
+        self,
+        executor: AsyncPsycoPGQueryExecutor,
+        timeout: float,
+        connection: psycopg.AsyncConnection | None,
+    ):
+        self.executor = executor
+        self.timeout = timeout
+        self.connection = connection
+        self._ctx: AsyncContextManager[psycopg.AsyncConnection] | None = None
+
+    async def __aenter__(self) -> psycopg.AsyncConnection:
+        executor = self.executor
+        await executor.initialize()
+        connection = self.connection or executor._get_checkout()
+        if connection:
+            return connection
+        self._ctx = ctx = executor.pool.connection(timeout=self.timeout)
+        return await ctx.__aenter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        ctx, self._ctx = self._ctx, None
+        if ctx is not None:
+            return await ctx.__aexit__(exc_type, exc_val, exc_tb)
+
+
+class AsyncTransactionContext:
+    """Open a transaction on a connection, rolling back on exit if requested."""
+
+    __slots__ = ("connection_ctx", "rollback", "savepoint_name", "_transaction")
+
+    def __init__(
+        self,
+        connection_ctx: AsyncConnectionContext,
+        rollback: bool = False,
+        savepoint_name: str | None = None,
+    ):
+        self.connection_ctx = connection_ctx
+        self.rollback = rollback
+        self.savepoint_name = savepoint_name
+        self._transaction: AsyncContextManager | None = None
+
+    async def __aenter__(self) -> psycopg.AsyncConnection:
+        conn = await self.connection_ctx.__aenter__()
+        try:
+            self._transaction = transaction = conn.transaction(
+                savepoint_name=self.savepoint_name, force_rollback=self.rollback
+            )
+            await transaction.__aenter__()
+        except BaseException as e:
+            await self.connection_ctx.__aexit__(type(e), e, e.__traceback__)
+            raise
+        return conn
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        transaction, self._transaction = self._transaction, None
+        try:
+            suppress = await transaction.__aexit__(exc_type, exc_val, exc_tb)
+        except BaseException as e:
+            await self.connection_ctx.__aexit__(type(e), e, e.__traceback__)
+            raise
+        if suppress:
+            exc_type = exc_val = exc_tb = None
+        return (
+            await self.connection_ctx.__aexit__(exc_type, exc_val, exc_tb) or suppress
+        )
+
+
+class ConnectionContext:
+    """Acquire a connection from the executor's pool, unless one is provided.
+
+    This is hand-written rather than built with `contextlib`, since it is entered
+    for every query.
+    """
+
+    __slots__ = ("executor", "timeout", "connection", "_ctx")
+
+    def __init__(
+        self,
+        executor: PsycoPGQueryExecutor,
+        timeout: float,
+        connection: psycopg.Connection | None,
+    ):
+        self.executor = executor
+        self.timeout = timeout
+        self.connection = connection
+        self._ctx: ContextManager[psycopg.Connection] | None = None
+
+    def __enter__(self) -> psycopg.Connection:
+        executor = self.executor
+        executor.initialize()
+        connection = self.connection or executor._get_checkout()
+        if connection:
+            return connection
+        self._ctx = ctx = executor.pool.connection(timeout=self.timeout)
+        return ctx.__enter__()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        ctx, self._ctx = self._ctx, None
+        if ctx is not None:
+            return ctx.__exit__(exc_type, exc_val, exc_tb)
+
+
+class TransactionContext:
+    """Open a transaction on a connection, rolling back on exit if requested."""
+
+    __slots__ = ("connection_ctx", "rollback", "savepoint_name", "_transaction")
+
+    def __init__(
+        self,
+        connection_ctx: ConnectionContext,
+        rollback: bool = False,
+        savepoint_name: str | None = None,
+    ):
+        self.connection_ctx = connection_ctx
+        self.rollback = rollback
+        self.savepoint_name = savepoint_name
+        self._transaction: ContextManager | None = None
+
+    def __enter__(self) -> psycopg.Connection:
+        conn = self.connection_ctx.__enter__()
+        try:
+            self._transaction = transaction = conn.transaction(
+                savepoint_name=self.savepoint_name, force_rollback=self.rollback
+            )
+            transaction.__enter__()
+        except BaseException as e:
+            self.connection_ctx.__exit__(type(e), e, e.__traceback__)
+            raise
+        return conn
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        transaction, self._transaction = self._transaction, None
+        try:
+            suppress = transaction.__exit__(exc_type, exc_val, exc_tb)
+        except BaseException as e:
+            self.connection_ctx.__exit__(type(e), e, e.__traceback__)
+            raise
+        if suppress:
+            exc_type = exc_val = exc_tb = None
+        return self.connection_ctx.__exit__(exc_type, exc_val, exc_tb) or suppress
+
+
 @typic.settings(
     prefix="POSTGRES_POOL_",
     aliases={
@@ -624,7 +879,8 @@ class PsycoPGConnectionSettings:
     user: Optional[str] = None
     password: Optional[typic.SecretStr] = None
     passfile: Optional[typic.SecretStr] = None
-    autocommit: bool = False
+    autocommit: bool = True
+    prepare_threshold: Optional[int] = 3
 
 
 def create_sync_pool(**overrides) -> pgpool.ConnectionPool:
@@ -638,35 +894,60 @@ def create_async_pool(**overrides) -> pgpool.AsyncConnectionPool:
 
 
 def _get_environ(**overrides) -> dict:
-    pool_settings = PsycoPGPoolSettings()
-    connect_settings = PsycoPGConnectionSettings()
-    pool_fields = {k for k, v in pool_settings}  # type: ignore[attr-defined]
-    conn_fields = {k for k, v in connect_settings}  # type: ignore[attr-defined]
-    pool_kwargs = {k: v for k, v in pool_settings if v is not None}  # type: ignore[attr-defined]
-    pool_kwargs.update(((k, v) for k, v in overrides.items() if k in pool_fields))
-    connect_kwargs = {
-        k: v
-        for k, v in connect_settings  # type: ignore[attr-defined]
-        if v is not None and k not in pool_kwargs
-    }
-    connect_kwargs.update(((k, v) for k, v in overrides.items() if k in conn_fields))
-    if "dsn" in pool_kwargs:
-        pool_kwargs["conninfo"] = pool_kwargs.pop("dsn")
-    if "dsn" in connect_kwargs:
-        dsn = connect_kwargs.pop("dsn")
+    pool_base, conn_base = _get_base_environ()
+    keys = overrides.keys()
+    pool_kwargs = {**pool_base}
+    pool_kwargs.update((k, overrides[k]) for k in _POOL_FIELDS & keys)
+    connect_kwargs = {k: v for k, v in conn_base.items() if k not in pool_kwargs}
+    connect_kwargs.update((k, overrides[k]) for k in _CONN_FIELDS & keys)
+    if (dsn := pool_kwargs.pop("dsn", None)) is not None:
+        pool_kwargs["conninfo"] = dsn
+    if (dsn := connect_kwargs.pop("dsn", None)) is not None:
         if "conninfo" not in pool_kwargs:
             connect_kwargs["conninfo"] = dsn
     pool_kwargs["kwargs"] = connect_kwargs
     return pool_kwargs
 
 
+@functools.lru_cache(maxsize=1)
+def _get_base_environ() -> tuple[dict, dict]:
+    # The environment is only read once per process.
+    #   Use `_reset_environ_cache()` to pick up changes.
+    pool_settings = PsycoPGPoolSettings()
+    connect_settings = PsycoPGConnectionSettings()
+    pool_base = {k: v for k, v in pool_settings if v is not None}  # type: ignore[attr-defined]
+    conn_base = {k: v for k, v in connect_settings if v is not None}  # type: ignore[attr-defined]
+    return pool_base, conn_base
+
+
+def _reset_environ_cache():
+    _get_base_environ.cache_clear()
+
+
+_POOL_FIELDS = frozenset(
+    f.name for f in dataclasses.fields(PsycoPGPoolSettings)  # type: ignore[arg-type]
+)
+_CONN_FIELDS = frozenset(
+    f.name for f in dataclasses.fields(PsycoPGConnectionSettings)  # type: ignore[arg-type]
+)
+
+
+def _cursor_name() -> str:
+    # Server-side cursors must have a unique name within the session.
+    return f"yesql_{next(_CURSOR_IDS)}"
+
+
+_CURSOR_IDS = itertools.count()
+
+
+@functools.lru_cache(maxsize=1)
 def _init_psycopg():
+    # Configure psycopg's global adapters once, when the first executor is created.
     # Use a faster loader for JSON serdes
-    pgjson.set_json_dumps(support.dumps)
+    #   psycopg accepts bytes from `dumps` and sends them as-is,
+    #   so skip the decode (and psycopg's re-encode) of a str.
+    pgjson.set_json_dumps(support.dumpsb)
     pgjson.set_json_loads(support.loads)
     # Register `set()` type as an array type.
-    psycopg.adapters.register_dumper(set, pgarray.ListBinaryDumper)
+    #   The binary list dumper indexes into its input, so it can't dump a set.
     psycopg.adapters.register_dumper(set, pgarray.ListDumper)
-
-
-_init_psycopg()  # naughty naughty...
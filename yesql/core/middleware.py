@@ -74,4 +74,5 @@ def middleware(*names: str):
 
 
 def ismiddleware(o) -> TypeGuard[types.MiddlewareMethodProtocolT]:
-    return callable(o) and hasattr(o, "__intercepts__")
+    # Only functions are flagged by `middleware()`, so the flag alone is sufficient.
+    return getattr(o, "__intercepts__", None) is not None
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import collections
+import concurrent.futures
 import dataclasses
 import functools
 import inspect
+import os
 import pathlib
 import re
 import sys
+import types
 import warnings
-from typing import TYPE_CHECKING, Deque, Final, Literal, Optional, Tuple, cast
+from typing import TYPE_CHECKING, Final, Iterator, Literal, Mapping, Optional, Tuple
 
 import sqlparse
 import typic
@@ -38,6 +40,7 @@ def parse(
     *,
     driver: SupportedDriversT,
     modname: str | None = None,
+    workers: int | None = None,
 ) -> QueryPackage:
     """Parse a string or path, returning a QueryPackage, for building a query library.
 
@@ -53,6 +56,9 @@ def parse(
         modname: optional
             The name root name of the "module" for this library. Defaults to the name
             of the root directory or file of the query library.
+        workers: optional
+            If set, parse the modules of a query library across this many processes.
+            Only worthwhile for large libraries. Defaults to parsing in-process.
     """
 
     # If we have a raw string or a single module, create a package from that.
@@ -65,46 +71,93 @@ def parse(
             modname = modname or "<locals>"
         module = parse_module(queries=queries, modname=modname, driver=driver)
         return QueryPackage(name=modname, path=path, modules={module.name: module})
-    # Otherwise, traverse the package with BFS, building the query tree.
+    # Otherwise, traverse the package depth-first, building the query tree.
     # Create the root package.
     package = QueryPackage(name=modname or queries.stem, modules={}, path=queries)
-    stack: Deque[QueryPackage] = collections.deque([package])
-    while stack:
-        pkg = stack.popleft()
-        # Traverse the directory, looking for modules to parse into QueryDatum
-        for child in pkg.path.iterdir():
-            # If we found a directory, add it to the stack and attach it to the parent.
-            if child.is_dir() and child.name != "__pycache__":
-                cpkg = QueryPackage(name=child.stem, modules={}, path=child)
-                stack.append(cpkg)
-                pkg.packages[cpkg.name] = cpkg
+    sources = [*_walk_package(package)]
+    # Each module is parsed independently, so we can fan out to a process pool.
+    reader = functools.partial(_read_queries, driver=driver)
+    paths = [path for _, path in sources]
+    if workers and len(sources) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed = [*executor.map(reader, paths)]
+    else:
+        parsed = [*map(reader, paths)]
+    for (pkg, path), data in zip(sources, parsed):
+        pkg.modules[path.stem] = QueryModule(path.stem, queries=data, path=path)
+    return package
+
+
+def _walk_package(
+    package: QueryPackage,
+) -> Iterator[tuple[QueryPackage, pathlib.Path]]:
+    # DirEntry caches the file type reported by the OS, so we avoid a `stat`
+    #   per child when checking for directories and files.
+    with os.scandir(package.path) as entries:
+        for entry in entries:
+            path = pathlib.Path(entry.path)
+            # If we found a directory, attach it to the parent and descend into it.
+            if entry.is_dir():
+                if entry.name == "__pycache__":
+                    continue
+                cpkg = QueryPackage(name=path.stem, modules={}, path=path)
+                package.packages[cpkg.name] = cpkg
+                yield from _walk_package(cpkg)
                 continue
-            if child.suffix != ".sql":
+            if path.suffix != ".sql" or not entry.is_file():
                 continue
-            # Otherwise, parse the module and attach it to the package.
-            module = parse_module(queries=child, modname=child.stem, driver=driver)
-            pkg.modules[module.name] = module
-
-    return package
+            # Otherwise, yield the module so it can be parsed into the package.
+            yield package, path
 
 
 def parse_module(
     *, queries: str | pathlib.Path, modname: str, driver: SupportedDriversT
 ) -> QueryModule:
     if isinstance(queries, str):
-        data = {
-            datum.name: datum
-            for statement in sqlparse.parse(queries)
-            if (datum := get_query_datum(statement, driver=driver))
-        }
-        return QueryModule(modname, queries=data, path=pathlib.Path.cwd())
-    with queries.open() as file:
-        data = {
-            d.name: d
-            for statement in sqlparse.parsestream(file)
-            if (d := get_query_datum(statement, driver=driver))
-        }
-        return QueryModule(modname, queries=data, path=queries)
+        return QueryModule(
+            modname,
+            queries=_parse_queries(queries, driver=driver),
+            path=pathlib.Path.cwd(),
+        )
+    return QueryModule(
+        modname, queries=_read_queries(queries, driver=driver), path=queries
+    )
+
+
+def _read_queries(
+    path: pathlib.Path, *, driver: SupportedDriversT
+) -> dict[str, QueryDatum]:
+    # This must remain a module-level function returning plain data,
+    #   so that it may be sent to a process pool.
+    return _parse_queries(path.read_text(), driver=driver)
+
+
+def _parse_queries(text: str, *, driver: SupportedDriversT) -> dict[str, QueryDatum]:
+    # A source with no named queries (e.g., DDL or fixtures) has nothing for us;
+    #   a single regex scan is far cheaper than tokenizing it.
+    if not FUNC_PATTERN.search(text):
+        return {}
+    # Data aren't cached per statement: that would need the statement's token tree
+    #   alongside its text, and `parse()` already caches whole libraries.
+    return {
+        datum.name: datum
+        for statement in _parse_text(text)
+        if (datum := get_query_datum(statement, driver=driver))
+    }
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_text(text: str) -> tuple[sqlparse.sql.Statement, ...]:
+    # Tokenizing is independent of the driver, so share it across parses.
+    #   Each entry pins a module's source and token tree for the life of the process,
+    #   so keep only enough for a realistic query library.
+    #   Use `_reset_parse_cache()` to release them.
+    return sqlparse.parse(text)
+
+
+def _reset_parse_cache():
+    parse.cache_clear()
+    _parse_text.cache_clear()
 
 
 def get_query_datum(
@@ -177,19 +230,17 @@ def get_funcop(lead: str) -> tuple[str | None, ModifierT]:
     match = FUNC_PATTERN.match(lead)
     if not match:
         return None, MANY
-    name = match.group("name")
-    modifier = match.group("modifier")
-    if not modifier:
+    name, raw = match.groups()
+    modifier = _MODIFIERS_BY_ALIAS.get(raw)
+    if modifier is None:
         warnings.warn(
-            f"Unrecognized query modifier: {modifier!r}. "
+            f"Unrecognized query modifier: {raw!r}. "
             f"Recognized modifiers are: {(*MODIFIERS,)}. "
             f"Defaulting to {MANY!r}.",
             stacklevel=10,
         )
         modifier = MANY
-    elif modifier in _SHORT_TO_LONG:
-        modifier = _SHORT_TO_LONG[modifier]
-    return name, cast(ModifierT, modifier)
+    return name, modifier
 
 
 def process_sql(
@@ -206,8 +257,13 @@ def process_sql(
         posargs.update(pos)
         kwdargs.update(kwd)
 
-    sig = inspect.Signature([*posargs.values(), *kwdargs.values()])
-    sql, remapping = _normalize_parameters(str(statement), driver, posargs, kwdargs)
+    # Our parameters are already ordered (positional-only, then keyword-only) and
+    #   have no defaults, so skip the Signature's per-parameter validation.
+    sig = inspect.Signature(
+        [*posargs.values(), *kwdargs.values()],
+        __validate_parameters__=False,
+    )
+    sql, remapping = _normalize_parameters(statement, driver, posargs, kwdargs)
     return sql, sig, remapping
 
 
@@ -217,48 +273,75 @@ def _gather_parameters(
     kwdargs = {}
     posargs = {}
     argnum = 0
+    # Token types are singletons, so we can compare by identity.
+    placeholder = sqlparse.tokens.Name.Placeholder
     for token in token.flatten():
-        if not token.ttype == sqlparse.tokens.Name.Placeholder:
+        if token.ttype is not placeholder:
             continue
-        name = token.value[2:-2] if token.value.startswith("%(") else token.value[1:]
+        value = token.value
+        name = value[2:-2] if value.startswith("%(") else value[1:]
         if not name:
             argnum += 1
             name = str(argnum)
+        # A named placeholder may be referenced many times; we only need it once.
+        elif value in kwdargs or value in posargs:
+            continue
         if name.isdigit():
             name = f"arg{name}"
             kind = inspect.Parameter.POSITIONAL_ONLY
-            posargs[token.value] = inspect.Parameter(name, kind)
+            posargs[value] = inspect.Parameter(name, kind)
             continue
-        kwdargs[token.value] = inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY)
+        kwdargs[value] = inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY)
     return posargs, kwdargs
 
 
 def _normalize_parameters(
-    statement: str,
+    statement: str | sqlparse.sql.Statement,
     driver: SupportedDriversT,
     posargs: dict[str, inspect.Parameter],
     kwdargs: dict[str, inspect.Parameter],
 ) -> tuple[str, dict[str, int] | None]:
-    sql, remapping = statement, None
+    remapping = None
     if not kwdargs:
-        return sql, remapping
+        return _replace(statement, {}), remapping
 
+    replacements: dict[str, str] = {}
     if driver == "asyncpg":
         remapping = {}
         start = 1
         if posargs:
             start = [int(a.name.replace("arg", "")) for a in posargs.values()][-1] + 1
         for i, (name, param) in enumerate(kwdargs.items(), start=start):
-            sql = _replace(name=name, replacement=f"${i}", sql=sql)
+            replacements[name] = f"${i}"
             remapping[param.name] = i
     elif driver == "psycopg":
-        for name, param in kwdargs.items():
-            sql = _replace(name=name, replacement=f"%({param.name})s", sql=sql)
-    return sql, remapping
+        replacements = {name: f"%({p.name})s" for name, p in kwdargs.items()}
+    return _replace(statement, replacements), remapping
+
+
+def _replace(
+    statement: str | sqlparse.sql.Statement, replacements: dict[str, str]
+) -> str:
+    # Substitute the placeholder tokens in a single pass over the statement.
+    #   The lexer already separates `::` casts from placeholders.
+    #   If we have a parsed statement, re-use its tokens rather than re-lexing.
+    if isinstance(statement, str):
+        if not replacements:
+            return statement
+        tokens = sqlparse.lexer.tokenize(statement)
+    else:
+        if not replacements:
+            return statement.value
+        tokens = ((t.ttype, t.value) for t in statement.flatten())
+    placeholder = sqlparse.tokens.Name.Placeholder
+    return "".join(
+        replacements.get(value, value) if ttype is placeholder else value
+        for ttype, value in tokens
+    )
 
 
-def _replace(*, name: str, replacement: str, sql: str) -> str:
-    return re.sub(r"(?<!:)" + name, replacement, sql)
+def _split_comments(comment: str) -> list[str]:
+    return [c.strip() for c in _MULTILINE_DELIMITERS.sub("", comment).splitlines()]
 
 
 if sys.version_info >= (3, 9):
@@ -266,33 +349,20 @@ if sys.version_info >= (3, 9):
     def _clean_comment(comment: str) -> str:
         return comment.strip().removeprefix(_PRE).strip()
 
-    def _split_comments(comment: str) -> list[str]:
-        return [
-            c.strip()
-            for c in comment.strip()
-            .removeprefix("/**")
-            .removesuffix("**/")
-            .splitlines()
-        ]
-
 else:
 
     def _clean_comment(comment: str) -> str:
         return comment.strip().strip(_PRE).strip()
 
-    def _split_comments(comment: str) -> list[str]:
-        return [
-            c.strip() for c in comment.strip().strip("/**").rstrip("**/").splitlines()
-        ]
-
 
 _PRE = "--"
+_MULTILINE_DELIMITERS = re.compile(r"\A\s*/\*+\s*|\s*\*+/\s*\Z")
 
 FUNC_PATTERN = re.compile(
     # The name of the query
-    r":name\s+(?P<name>(\w+([-_])?\w+)+)"
+    r":name\s+(?P<name>\w[\w-]*)"
     # The operation modifier
-    r"(\s+:(?P<modifier>[*^$!#~]|many|one|scalar|multi|affected|raw))?"
+    r"(?:\s+:(?P<modifier>[*^$!#~]|many|one|scalar|multi|affected|raw))?"
 )
 
 MANY: Final = "many"
@@ -311,6 +381,11 @@ _SHORT_TO_LONG: dict[str, ModifierT] = {
     "#": AFFECTED,
     "~": RAW,
 }
+# Every accepted spelling of a modifier, mapped to its canonical name.
+_MODIFIERS_BY_ALIAS: dict[str, ModifierT] = {
+    **{m: m for m in MODIFIERS},  # type: ignore[misc]
+    **_SHORT_TO_LONG,
+}
 _ProcessedT = Optional[Tuple[str, inspect.Signature, Optional[dict]]]
 
 
@@ -325,17 +400,26 @@ class QueryDatum:
     remapping: dict | None = dataclasses.field(default=None, hash=False)
 
 
-@typic.slotted(dict=False, weakref=True)
+@typic.slotted(dict=True, weakref=True)
 @dataclasses.dataclass
 class QueryModule:
     name: str
     path: pathlib.Path
-    queries: dict[str, QueryDatum]
+    queries: Mapping[str, QueryDatum]
+
+    def __post_init__(self):
+        # The queries are fixed once parsed, so freeze them.
+        self.queries = types.MappingProxyType({**self.queries})
+        # Bind the queries directly to the instance, so that lookups on a known
+        #   query don't need to fall through to `__getattr__`.
+        #   Our fields are slots, so a query can never shadow them.
+        self.__dict__.update(self.queries)
 
     def __getattr__(self, item: str) -> QueryDatum:
-        if item not in self.queries:
-            raise AttributeError(f"{item!r}")
-        return self.queries[item]
+        try:
+            return self.queries[item]
+        except KeyError:
+            raise AttributeError(f"{item!r}") from None
 
 
 @typic.slotted(dict=False, weakref=True)
@@ -347,8 +431,11 @@ class QueryPackage:
     packages: dict[str, QueryPackage] = dataclasses.field(default_factory=dict)
 
     def __getattr__(self, item: str) -> QueryModule | QueryPackage:
-        if item in self.packages:
+        try:
             return self.packages[item]
-        if item in self.modules:
+        except KeyError:
+            pass
+        try:
             return self.modules[item]
-        raise AttributeError(f"{item!r}")
+        except KeyError:
+            raise AttributeError(f"{item!r}") from None
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import asyncio
-import dataclasses
-import functools
+import collections.abc
+import datetime
 import inspect
+import random
 import time
 import typing
+import uuid
+import weakref
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -35,6 +38,7 @@ __all__ = (
 )
 
 _T = TypeVar("_T")
+_FT = TypeVar("_FT", bound=Callable)
 
 
 def retry(
@@ -43,11 +47,16 @@ def retry(
     *errors: type[BaseException],
     retries: int = 10,
     delay: float = 0.1,
+    max_delay: float = 5.0,
+    jitter: bool = True,
     isaio: bool = False,
 ):
     """Automatically retry a database operation on a transient error.
 
-    "Transient" errors are configured by the query executor.
+    "Transient" errors are configured by the query executor. The first retry only
+    yields; after that, retries back off exponentially from `delay`, up to
+    `max_delay`. With `jitter`, each wait is randomized between zero and the
+    current backoff.
     """
 
     def _retry_impl(
@@ -60,37 +69,29 @@ def retry(
         if _isaio:
             afunc = cast(Callable[..., Awaitable[_T]], func_)
 
-            @functools.wraps(afunc)
             async def _retry(self: types.RepositoryProtocolT, *args, **kwargs):
-                errs = (*_errors, *self.TRANSIENT)
-                async with _AsyncRetryContext(
-                    svc=self,
-                    func=afunc,
-                    args=args,
-                    kwargs=kwargs,
-                    errors=errs,
-                    retries=_retries,
-                    delay=delay,
-                ) as result:
-                    return result
-
-        else:
-
-            @functools.wraps(func_)
-            def _retry(self: types.RepositoryProtocolT, *args, **kwargs):
-                errs = (*_errors, *self.TRANSIENT)
-                with _SyncRetryContext(
-                    svc=self,
-                    func=func_,
-                    args=args,
-                    kwargs=kwargs,
-                    errors=errs,
-                    retries=_retries,
-                    delay=delay,
-                ) as result:
-                    return result
-
-        return _retry
+                errs = (*_errors, *self.TRANSIENT) if _errors else self.TRANSIENT
+                for tries in range(_retries + 1):
+                    try:
+                        return await afunc(self, *args, **kwargs)
+                    except errs:
+                        if tries == _retries:
+                            raise
+                        await _asleep(_backoff(tries, delay, max_delay, jitter))
+
+            return _copy_meta(afunc, _retry)
+
+        def _retry_sync(self: types.RepositoryProtocolT, *args, **kwargs):
+            errs = (*_errors, *self.TRANSIENT) if _errors else self.TRANSIENT
+            for tries in range(_retries + 1):
+                try:
+                    return func_(self, *args, **kwargs)
+                except errs:
+                    if tries == _retries:
+                        raise
+                    time.sleep(_backoff(tries, delay, max_delay, jitter))
+
+        return _copy_meta(func_, _retry_sync)
 
     return _retry_impl(func) if func else _retry_impl
 
@@ -101,11 +102,16 @@ def retry_cursor(
     *errors: Type[BaseException],
     retries: int = 10,
     delay: float = 0.1,
+    max_delay: float = 5.0,
+    jitter: bool = True,
     isaio: bool = False,
 ):
     """Automatically retry a database operation on a transient error.
 
-    "Transient" errors are configured by the connector protocol.
+    "Transient" errors are configured by the connector protocol. The first retry
+    only yields; after that, retries back off exponentially from `delay`, up to
+    `max_delay`. With `jitter`, each wait is randomized between zero and the
+    current backoff.
     """
 
     def _retry_impl(
@@ -117,9 +123,8 @@ def retry_cursor(
         _isaio = isaio or _isasync(func_)
         context_cls = _AsyncRetryCursorContext if _isaio else _SyncRetryCursorContext
 
-        @functools.wraps(func_)
         def _retry_cursor(self: types.RepositoryProtocolT, *args, **kwargs):
-            errs = (*_errors, *self.TRANSIENT)
+            errs = (*_errors, *self.TRANSIENT) if _errors else self.TRANSIENT
             return context_cls(
                 svc=self,
                 func=func_,
@@ -128,125 +133,176 @@ def retry_cursor(
                 errors=errs,
                 retries=retries,
                 delay=delay,
+                max_delay=max_delay,
+                jitter=jitter,
             )
 
-        return _retry_cursor
+        return _copy_meta(func_, _retry_cursor)
 
     return _retry_impl(func) if func else _retry_impl
 
 
-@typic.slotted(dict=False, weakref=True)
-@dataclasses.dataclass
-class _RetryContext:
-    svc: types.RepositoryProtocolT
-    func: Callable
-    args: tuple
-    kwargs: dict
-    errors: tuple[Type[BaseException], ...]
-    retries: int
-    delay: float
+def _copy_meta(src: Callable, dst: _FT) -> _FT:
+    # A lighter `functools.wraps`: we don't need the wrapped function's `__dict__`
+    #   or annotations, and `inspect.unwrap` will follow `__wrapped__`.
+    for attr in _META:
+        try:
+            setattr(dst, attr, getattr(src, attr))
+        except AttributeError:
+            pass
+    dst.__wrapped__ = src  # type: ignore[attr-defined]
+    return dst
 
-    def _do_exec(self):
-        return self.func(self.svc, *self.args, **self.kwargs)
 
+_META = ("__module__", "__name__", "__qualname__", "__doc__")
 
-class _SyncRetryContext(_RetryContext):
-    def __enter__(self):
-        do, tries, retries, errors, delay = (
-            self._do_exec,
-            0,
-            self.retries,
-            self.errors,
-            self.delay,
-        )
-        try:
-            return do()
-        except errors as e:
-            time.sleep(delay)
-            while tries < retries:
-                tries += 1
-                try:
-                    return do()
-                except errors:
-                    time.sleep(delay)
-            raise e
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        pass
+class _RetryContext:
+    __slots__ = (
+        "svc",
+        "func",
+        "args",
+        "kwargs",
+        "errors",
+        "retries",
+        "delay",
+        "max_delay",
+        "jitter",
+        "ctx",
+    )
 
+    def __init__(
+        self,
+        *,
+        svc: types.RepositoryProtocolT,
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+        errors: tuple[Type[BaseException], ...],
+        retries: int,
+        delay: float,
+        max_delay: float,
+        jitter: bool,
+    ):
+        self.svc = svc
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.errors = errors
+        self.retries = retries
+        self.delay = delay
+        self.max_delay = max_delay
+        self.jitter = jitter
 
-class _SyncRetryCursorContext(_SyncRetryContext):
-    __slots__ = ("ctx",)
 
-    func: Callable[..., ContextManager]
+class _SyncRetryCursorContext(_RetryContext):
+    __slots__ = ()
 
-    def _do_exec(self):
-        self.ctx = self.func(self.svc, *self.args, **self.kwargs)
-        return self.ctx.__enter__()
+    def __enter__(self):
+        retries, errors = self.retries, self.errors
+        for tries in range(retries + 1):
+            try:
+                self.ctx = self.func(self.svc, *self.args, **self.kwargs)
+                return self.ctx.__enter__()
+            except errors:
+                if tries == retries:
+                    raise
+                time.sleep(_backoff(tries, self.delay, self.max_delay, self.jitter))
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         return self.ctx.__exit__(exc_type, exc_val, exc_tb)
 
 
-class _AsyncRetryContext(_RetryContext):
+class _AsyncRetryCursorContext(_RetryContext):
+    __slots__ = ()
+
     async def __aenter__(self):
-        do, tries, retries, errors, delay = (
-            self._do_exec,
-            0,
-            self.retries,
-            self.errors,
-            self.delay,
-        )
-        try:
-            return await do()
-        except errors as e:
-            await asyncio.sleep(delay)
-            while tries < retries:
-                tries += 1
-                try:
-                    return await do()
-                except errors:
-                    await asyncio.sleep(delay)
-            raise e
+        retries, errors = self.retries, self.errors
+        for tries in range(retries + 1):
+            try:
+                self.ctx = self.func(self.svc, *self.args, **self.kwargs)
+                return await self.ctx.__aenter__()
+            except errors:
+                if tries == retries:
+                    raise
+                await _asleep(_backoff(tries, self.delay, self.max_delay, self.jitter))
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        pass
+    def __aexit__(self, exc_type, exc_val, exc_tb):
+        return self.ctx.__aexit__(exc_type, exc_val, exc_tb)
 
 
-class _AsyncRetryCursorContext(_AsyncRetryContext):
-    __slots__ = ("ctx",)
+def _backoff(tries: int, delay: float, max_delay: float, jitter: bool) -> float:
+    # Retry immediately the first time (after yielding), since many transient
+    #   errors clear as soon as the competing operation completes.
+    if not tries:
+        return 0
+    backoff = min(delay * (1 << (tries - 1)), max_delay)
+    # "Full" jitter: anywhere up to the backoff, so that concurrent callers which
+    #   failed together don't retry together.
+    if jitter:
+        backoff *= _RANDOM.random()
+    return backoff
 
-    def _do_exec(self):
-        self.ctx = self.func(self.svc, *self.args, **self.kwargs)
-        return self.ctx.__aenter__()
 
-    def __aexit__(self, exc_type, exc_val, exc_tb):
-        return self.ctx.__aexit__(exc_type, exc_val, exc_tb)
+_RANDOM = random.Random()
+
+
+async def _asleep(delay: float):
+    # The event loop's selector waits in whole milliseconds, so a shorter timer
+    #   is rounded up to 1ms. Just yield to the loop once instead.
+    if delay < _MIN_ASYNC_SLEEP:
+        return await asyncio.sleep(0)
+    return await asyncio.sleep(delay)
+
+
+_MIN_ASYNC_SLEEP = 1e-3
 
 
 def _isasync(f):
+    try:
+        return _ISASYNC_CACHE[f]
+    except KeyError:
+        isasync = _ISASYNC_CACHE[f] = _resolve_isasync(f)
+        return isasync
+    except TypeError:
+        # This callable can't be weakly referenced, so it can't be cached.
+        return _resolve_isasync(f)
+
+
+def _resolve_isasync(f):
     unwrapped = inspect.unwrap(f)
-    hints = typic.get_type_hints(unwrapped)
-    returns = oreturns = hints.get("returns")
-    if returns:
-        oreturns = typing.get_origin(returns)
-    return (
-        inspect.iscoroutinefunction(unwrapped)
-        or inspect.isasyncgenfunction(unwrapped)
-        or typic.get_name(oreturns)
-        in {
-            "Awaitable",
-            "AsyncIterable",
-            "AsyncIterator",
-            "AsyncGenerator",
-            "Coroutine",
-        }
+    if inspect.iscoroutinefunction(unwrapped) or inspect.isasyncgenfunction(unwrapped):
+        return True
+    returns = typic.get_type_hints(unwrapped).get("return")
+    oreturns = typing.get_origin(returns) or returns
+    try:
+        return oreturns in _ASYNC_ORIGINS
+    except TypeError:
+        # Not hashable, so certainly not one of ours.
+        return False
+
+
+_ASYNC_ORIGINS = frozenset(
+    (
+        typing.Awaitable,
+        typing.AsyncIterable,
+        typing.AsyncIterator,
+        typing.AsyncGenerator,
+        typing.Coroutine,
+        collections.abc.Awaitable,
+        collections.abc.AsyncIterable,
+        collections.abc.AsyncIterator,
+        collections.abc.AsyncGenerator,
+        collections.abc.Coroutine,
     )
+)
+
+_ISASYNC_CACHE: weakref.WeakKeyDictionary[Callable, bool] = weakref.WeakKeyDictionary()
 
 
 def dumpsb(o: Any) -> bytes:
     """Encode any object to a JSON byte-string."""
-    return orjson.dumps(typic.primitive(o))
+    return _encode(o)
 
 
 def dumps(o: Any) -> str:
@@ -256,7 +312,28 @@ def dumps(o: Any) -> str:
     # can't write binary data to JSONB columns.
     # https://github.com/lib/pq/issues/528
     # This is still orders of magnitude faster than any other lib.
-    return orjson.dumps(typic.primitive(o)).decode()
-
+    return _encode(o).decode()
+
+
+def _encode(o: Any) -> bytes:
+    # Types which orjson encodes natively can go straight to orjson, which will
+    #   only call back to typic for any nested values it doesn't understand.
+    if isinstance(o, _NATIVE):
+        return orjson.dumps(o, default=typic.primitive, option=_OPTIONS)
+    return orjson.dumps(typic.primitive(o), option=_OPTIONS)
+
+
+_NATIVE = (
+    dict,
+    list,
+    tuple,
+    str,
+    int,
+    float,
+    type(None),
+    datetime.date,
+    uuid.UUID,
+)
+_OPTIONS = orjson.OPT_NON_STR_KEYS
 
 loads = orjson.loads
@@ -26,6 +26,7 @@ if TYPE_CHECKING:
 ModelT = TypeVar("ModelT")
 ScalarT = TypeVar("ScalarT", covariant=True)
 ConnectionT = TypeVar("ConnectionT")
+# Deserializers receive the raw query result, which may be empty (`None` or `[]`).
 DeserializerT = Callable[[Any], ModelT]
 SerializerT = Callable[[ModelT], Collection]
 CursorT = TypeVar("CursorT")
@@ -1,7 +1,18 @@
 from __future__ import annotations
 
+import functools
 import inspect
-from typing import TYPE_CHECKING, Any, Awaitable, Generic, Iterable, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Generic,
+    Iterable,
+    Mapping,
+    Sequence,
+    TypeVar,
+    Union,
+)
 
 import pypika
 
@@ -94,13 +105,11 @@ class DynamicQueryService(Generic[_MT]):
         """
         query = self._resolve_query(sql=query, modifier=modifier)
         executor = getattr(self.service.executor, modifier)
-        if modifier in {parse.MANY, parse.ONE, parse.MULTI} and coerce:
-            deserializer = deserializer or (
-                self.service.serdes.deserializer
-                if modifier == parse.ONE
-                else self.service.serdes.bulk_deserializer
+        deserializer_attr = _MODIFIER_DESERIALIZER.get(modifier)
+        if deserializer_attr and coerce:
+            kwargs["deserializer"] = deserializer or getattr(
+                self.service.serdes, deserializer_attr
             )
-            kwargs.update(deserializer=deserializer)
         return executor(
             query,
             *args,
@@ -156,6 +165,47 @@ class DynamicQueryService(Generic[_MT]):
             **kwargs,
         )
 
+    def execute_batch(
+        self,
+        query: Union[str, pypika.queries.QueryBuilder],
+        params: Iterable[Union[Sequence, Mapping[str, Any]]],
+        *,
+        connection: types.ConnectionT = None,
+        timeout: float = 10,
+        transaction: bool = True,
+        rollback: bool = False,
+    ):
+        """Execute any arbitrary query once for each set of parameters, in one batch.
+
+        The parameters are sent with the driver's `executemany`, which pipelines the
+        executions rather than making a round-trip for each one.
+
+        Args:
+            query:
+               Either a SQL string or a pypika Query.
+            params:
+               An iterable of the args (or kwargs) for each execution of the query.
+            connection: optional
+               A DBAPI connectable to use during executions.
+            timeout: defaults 10
+                The number of seconds to wait for the query to complete.
+            transaction: defaults True
+                Whether to execute this query within a transaction block.
+            rollback: defaults False
+                Whether to rollback the transaction scope of this query execution.
+        """
+        datum = self._resolve_query(sql=query, modifier=parse.MULTI)
+        return self.service.executor.multi(
+            datum,
+            params=params,
+            connection=connection,
+            timeout=timeout,
+            transaction=transaction,
+            rollback=rollback,
+            returns=False,
+            deserializer=None,
+        )
+
     def select(
         self,
         *fields,
@@ -291,10 +341,25 @@ class DynamicQueryService(Generic[_MT]):
         if isinstance(sql, pypika.queries.QueryBuilder):
             sql = sql.get_sql()
 
-        return parse.QueryDatum(
-            name="execute",
-            doc="",
-            sql=sql,
-            signature=inspect.Signature(),
-            modifier=modifier,
-        )
+        return _get_query_datum(sql, modifier)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_query_datum(sql: str, modifier: parse.ModifierT) -> parse.QueryDatum:
+    # QueryDatum is frozen, so repeated ad-hoc queries can share one.
+    return parse.QueryDatum(
+        name="execute",
+        doc="",
+        sql=sql,
+        signature=_EMPTY_SIGNATURE,
+        modifier=modifier,
+    )
+
+
+_EMPTY_SIGNATURE = inspect.Signature()
+# Modifiers which return full rows, mapped to the serdes attribute to coerce them.
+_MODIFIER_DESERIALIZER = {
+    parse.MANY: "bulk_deserializer",
+    parse.MULTI: "bulk_deserializer",
+    parse.ONE: "deserializer",
+}
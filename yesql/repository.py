@@ -1,18 +1,22 @@
 from __future__ import annotations
 
-import collections
 import dataclasses
+import functools
 import inspect
 import logging
+import operator
 import pathlib
+import threading
 from types import SimpleNamespace
 from typing import (
     Any,
+    Callable,
     ClassVar,
-    Deque,
     Dict,
     FrozenSet,
+    Generic,
     Iterable,
+    List,
     Literal,
     Optional,
     Tuple,
@@ -61,7 +65,22 @@ class QueryMetadata(types.MetadataT):
     __querylib__: ClassVar[Union[str, pathlib.Path]]
 
 
-class BaseQueryRepository(types.RepositoryProtocolT[_MT]):
+class _RepositoryMeta(type):
+    def __getattr__(cls, name: str):
+        # Statements are attached to the class when they're resolved, on first use.
+        #   So if we miss on a public name, resolve them and look again.
+        if name.startswith("_") or cls.__dict__.get("_resolved", True):
+            raise AttributeError(name)
+        # If another thread is resolving, wait for it. If this thread is, then this
+        #   lookup was made while resolving, and we mustn't recurse.
+        with cls._resolve_lock:
+            if cls.__dict__.get("_resolving", False):
+                raise AttributeError(name)
+            cls.__statements__
+        return type.__getattribute__(cls, name)
+
+
+class BaseQueryRepository(types.RepositoryProtocolT[_MT], metaclass=_RepositoryMeta):
     """The base class for a 'repository'.
 
     A 'repository' is responsible for querying a specific table.
@@ -82,6 +101,11 @@ class BaseQueryRepository(types.RepositoryProtocolT[_MT]):
     # Private attributes.
     _protocol: typic.SerdeProtocol[_MT | None]
     _bulk_protocol: typic.SerdeProtocol[Iterable[_MT]]
+    _middleware_map: ClassVar[dict[str, types.MiddlewareMethodProtocolT]]
+    _kvs: ClassVar[Callable[[types.ModelT], Dict[str, Any]]]
+    _resolved: ClassVar[bool]
+    _resolving: ClassVar[bool]
+    _resolve_lock: ClassVar[threading.RLock]
 
     __slots__ = ()
 
@@ -116,6 +140,10 @@ class BaseQueryRepository(types.RepositoryProtocolT[_MT]):
         """Tear down the query executor's connection to the underlying database."""
         return self.executor.teardown(timeout=timeout)
 
+    def __getattr__(self, item: str):
+        # Statements are resolved lazily, on the class.
+        return getattr(type(self), item)
+
     def __init_subclass__(cls, **kwargs):
         if cls.__name__ in {"AsyncQueryRepository", "SyncQueryRepository"}:
             return super().__init_subclass__(**kwargs)
@@ -128,27 +156,59 @@ class BaseQueryRepository(types.RepositoryProtocolT[_MT]):
         if not hasattr(cls.metadata, "__tablename__"):
             cls.metadata.__tablename__ = cls._get_table_name()
 
-        cls._protocol = typic.protocol(cls.model, is_optional=True)
-        cls._bulk_protocol = typic.protocol(Iterable[cls.model])
-        cls.serdes = statement.SerDes(
-            serializer=cls.get_kvs,
-            deserializer=cls._protocol.transmute,
-            bulk_deserializer=cls._bulk_protocol.transmute,
-        )
         cls.driver = drivers.get_driver(dialect=cls.metadata.__dialect__, aio=cls.isaio)
         cls.executor = cls.driver.executor()
-        cls.queries = cls._get_query_library()
-        cls.__statements__ = cls._resolve_statements()
+        # Loading the query library and building the protocols for the model is
+        #   expensive, so defer it until first use. Each subclass gets its own lazy
+        #   attributes, so it won't inherit what its parent has already generated.
+        for attr in _LAZY_ATTRIBUTES:
+            setattr(cls, attr.name, attr)
+        cls._resolved = cls._resolving = False
+        cls._resolve_lock = threading.RLock()
         return super().__init_subclass__(**kwargs)
 
     @classmethod
     def get_kvs(cls, model: types.ModelT) -> Dict[str, Any]:
         """Get a mapping of key-value pairs for your model without excluded fields."""
-        return {
-            field: value
-            for field, value in cls._protocol.iterate(model)
-            if field not in cls.metadata.__exclude_fields__
-        }
+        return cls._kvs(model)
+
+    @classmethod
+    def _get_kvs(cls) -> Callable[[types.ModelT], Dict[str, Any]]:
+        exclude = cls.metadata.__exclude_fields__
+        if not dataclasses.is_dataclass(cls.model):
+            iterate = cls._protocol.iterate
+
+            def _kvs(model: types.ModelT) -> Dict[str, Any]:
+                return {f: v for f, v in iterate(model) if f not in exclude}
+
+            return _kvs
+        # A dataclass's fields are fixed, so filter them once, up front.
+        fields = tuple(
+            f.name for f in dataclasses.fields(cls.model) if f.name not in exclude
+        )
+        if not fields:
+            return lambda model: {}
+        if len(fields) == 1:
+            (field,) = fields
+            return lambda model: {field: getattr(model, field)}
+        getter = operator.attrgetter(*fields)
+        return lambda model: dict(zip(fields, getter(model)))
+
+    @classmethod
+    def _get_protocol(cls) -> typic.SerdeProtocol[_MT | None]:
+        return typic.protocol(cls.model, is_optional=True)
+
+    @classmethod
+    def _get_bulk_protocol(cls) -> typic.SerdeProtocol[Iterable[_MT]]:
+        return typic.protocol(Iterable[cls.model])  # type: ignore[type-abstract,name-defined]
+
+    @classmethod
+    def _get_serdes(cls) -> statement.SerDes[_MT]:
+        return statement.SerDes(
+            serializer=cls.get_kvs,
+            deserializer=cls._protocol.transmute,
+            bulk_deserializer=cls._bulk_protocol.transmute,
+        )
 
     @classmethod
     def _get_table_name(cls) -> str:
@@ -188,23 +248,27 @@ class BaseQueryRepository(types.RepositoryProtocolT[_MT]):
 
         Overload this method to customize how your queries are bootstrapped.
         """
-        mwares = {
-            qname: mware
-            for _, mware in cls._iter_middlewares()
-            for qname in mware.__intercepts__
-        }
+        mwares = cls._get_middleware_map()
         available = cls._bootstrap_package(cls.queries, mwares)
+        # Collect every attribute name once, rather than walking the MRO per query.
+        existing = {
+            name
+            for klass in (*inspect.getmro(cls), *inspect.getmro(type(cls)))
+            for name in klass.__dict__
+        }
         for name, stmt in available.items():
             # Don't override a custom impl, but let them use it if they want.
-            if hasattr(cls, name):
+            if name in existing:
                 name = name + "_default"
             setattr(cls, name, stmt)
-        stack: _QueryPackageStack = collections.deque(
+            existing.add(name)
+        stack: _QueryPackageStack = [
             (cls, pkg) for pkg in cls.queries.packages.values()
-        )
+        ]
         # Build the tree of queries associated to this repository.
+        #   Order doesn't matter here, so pop from the end of the stack.
         while stack:
-            parent, package = stack.popleft()
+            parent, package = stack.pop()
             queries = cls._bootstrap_package(package, mwares)
             ns = SimpleNamespace(**queries)
             setattr(parent, package.name, ns)
@@ -241,10 +305,30 @@ class BaseQueryRepository(types.RepositoryProtocolT[_MT]):
                     available[stat.query.name] = stat
         return available
 
+    @classmethod
+    def _get_middleware_map(cls) -> dict[str, types.MiddlewareMethodProtocolT]:
+        # Look in this class's own namespace, so subclasses get their own map.
+        if "_middleware_map" not in cls.__dict__:
+            cls._middleware_map = {
+                qname: mware
+                for _, mware in cls._iter_middlewares()
+                for qname in mware.__intercepts__
+            }
+        return cls._middleware_map
+
     @classmethod
     def _iter_middlewares(cls) -> Iterable[tuple[str, types.MiddlewareMethodProtocolT]]:
-        for name, call in inspect.getmembers(cls, middleware.ismiddleware):
-            yield name, call
+        # Walk the namespaces directly, rather than `inspect.getmembers`,
+        #   which would sort and `getattr` every attribute in the hierarchy.
+        seen = set()
+        for klass in cls.__mro__:
+            for name, call in klass.__dict__.items():
+                # An override shadows its parents, whether it's a middleware or not.
+                if name in seen:
+                    continue
+                seen.add(name)
+                if middleware.ismiddleware(call):
+                    yield name, call
 
     def count(
         self,
@@ -269,9 +353,7 @@ class BaseQueryRepository(types.RepositoryProtocolT[_MT]):
         """
         if isinstance(query, str):
             query = cast(statement.Statement, getattr(self, query))
-        datum = query.query
-        sql = f"SELECT count(*) FROM ({query.query.sql.rstrip(';')}) AS q;"
-        stat = dataclasses.replace(datum, sql=sql)
+        stat = _get_count_datum(query.query)
         return self.executor.scalar(stat, *args, **kwargs)
 
     def explain(
@@ -317,10 +399,8 @@ class BaseQueryRepository(types.RepositoryProtocolT[_MT]):
         """
         if isinstance(query, str):
             query = cast(statement.Statement, getattr(self, query))
-        datum = query.query
         op = self.executor.get_explain_command(analyze, format)
-        sql = f"{op}{datum.sql}"
-        stat = dataclasses.replace(datum, sql=sql)
+        stat = _get_explain_datum(query.query, op)
         kwargs.update(transaction=True, rollback=True)
         if op == self.executor.EXPLAIN_PREFIX:
             kwargs["coerce"] = False
@@ -365,5 +445,57 @@ class SyncQueryRepository(BaseQueryRepository[_MT]):
         return
 
 
+# QueryDatum is frozen, so the derived queries only need to be built once.
+@functools.lru_cache(maxsize=1024)
+def _get_count_datum(datum: parse.QueryDatum) -> parse.QueryDatum:
+    sql = f"SELECT count(*) FROM ({datum.sql.rstrip(';')}) AS q;"
+    return dataclasses.replace(datum, sql=sql)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_explain_datum(datum: parse.QueryDatum, op: str) -> parse.QueryDatum:
+    return dataclasses.replace(datum, sql=f"{op}{datum.sql}")
+
+
+class _LazyClassAttribute(Generic[_RT]):
+    """A generated class attribute, computed on first access and cached on the class."""
+
+    __slots__ = ("name", "func")
+
+    def __init__(self, name: str, func: Callable[[Any], _RT]):
+        self.name = name
+        self.func = func
+
+    def __get__(self, instance, owner) -> _RT:
+        with owner._resolve_lock:
+            # Another thread may have generated this while we waited for the lock.
+            value = owner.__dict__.get(self.name, self)
+            if value is self:
+                value = self.func(owner)
+                setattr(owner, self.name, value)
+            return value
+
+
+def _get_statements(cls: Type[BaseQueryRepository]) -> dict[str, statement.Statement]:
+    # Flag that we're resolving, so lookups made while resolving don't recurse.
+    cls._resolving = True
+    try:
+        statements = cls._resolve_statements()
+    finally:
+        cls._resolving = False
+    cls._resolved = True
+    return statements
+
+
+_LAZY_ATTRIBUTES = (
+    _LazyClassAttribute("_protocol", lambda cls: cls._get_protocol()),
+    _LazyClassAttribute("_bulk_protocol", lambda cls: cls._get_bulk_protocol()),
+    _LazyClassAttribute("_kvs", lambda cls: cls._get_kvs()),
+    _LazyClassAttribute("serdes", lambda cls: cls._get_serdes()),
+    _LazyClassAttribute("queries", lambda cls: cls._get_query_library()),
+    _LazyClassAttribute("__statements__", _get_statements),
+)
+
+
 _QueryNamespaceT = Union[Type[types.RepositoryProtocolT], SimpleNamespace]
-_QueryPackageStack = Deque[Tuple[_QueryNamespaceT, parse.QueryPackage]]
+_QueryPackageStack = List[Tuple[_QueryNamespaceT, parse.QueryPackage]]
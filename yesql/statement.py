@@ -50,19 +50,21 @@ def statements(
     Queries which may return multiple results or perform multiple executions will have a
     standard statement and a cursor statement.
     """
-    return [
-        cls(query=query, executor=executor, middleware=middleware, serdes=serdes)
-        for cls in _MODIFIER_TO_STATEMENTS[query.modifier]
-    ]
+    stmt_cls, cursor_cls = _MODIFIER_TO_STATEMENTS[query.modifier]
+    stmt = stmt_cls(
+        query=query, executor=executor, middleware=middleware, serdes=serdes
+    )
+    if cursor_cls is None:
+        return (stmt,)
+    cursor = cursor_cls(
+        query=query, executor=executor, middleware=middleware, serdes=serdes
+    )
+    return stmt, cursor
 
 
 _T = TypeVar("_T")
 
 
-SentinelType = type("NoneType")
-Sentinel = SentinelType()
-
-
 class Statement(Generic[_T]):
     """A callable representing a single execution context for the associated query.
 
@@ -83,14 +85,18 @@ class Statement(Generic[_T]):
     __slots__ = (
         "query",
         "name",
-        "executor",
-        "serdes",
+        "_executor",
+        "_exec",
+        "_serdes",
+        "_deserializer",
         "_middleware",
         "__call__",
     )
     query: parse.QueryDatum
-    executor: base.BaseQueryExecutor
-    serdes: SerDes[_T]
+    # The executor method which runs this statement.
+    _EXECUTOR: str | None = None
+    # The SerDes attribute for the default deserializer of this statement.
+    _DESERIALIZER = "bulk_deserializer"
 
     def __init__(
         self,
@@ -116,6 +122,30 @@ class Statement(Generic[_T]):
             f">"
         )
 
+    @property
+    def executor(self) -> base.BaseQueryExecutor:
+        return self._executor
+
+    @executor.setter
+    def executor(self, executor: base.BaseQueryExecutor | None):
+        self._executor = executor
+        # Bind the executor method up front, rather than on every execution.
+        self._exec = (
+            getattr(executor, self._EXECUTOR)
+            if executor is not None and self._EXECUTOR
+            else None
+        )
+
+    @property
+    def serdes(self) -> SerDes[_T]:
+        return self._serdes
+
+    @serdes.setter
+    def serdes(self, serdes: SerDes[_T]):
+        self._serdes = serdes
+        # Bind the default deserializer up front, rather than on every execution.
+        self._deserializer = getattr(serdes, self._DESERIALIZER)
+
     @property
     def middleware(self) -> types.MiddlewareMethodProtocolT:
         return self._middleware
@@ -159,7 +189,7 @@ class Statement(Generic[_T]):
         This will pass the :py::class:`~yesql.uow.Statement` instance to the middleware
         alongside the parameters provided at call-time.
         """
-        deserializer = deserializer or self.serdes.bulk_deserializer
+        deserializer = deserializer or self._serdes.bulk_deserializer
         if deserializer:
             kwargs["deserializer"] = deserializer
 
@@ -178,9 +208,9 @@ class Statement(Generic[_T]):
         *,
         instance: _T,
         serializer: types.SerializerT | None,
-        args: Sequence,
+        args: tuple,
         kwargs: dict,
-    ) -> tuple[Sequence, dict]:
+    ) -> tuple[tuple, dict]:
         if instance is None:
             return args, kwargs
 
@@ -206,13 +236,17 @@ class Statement(Generic[_T]):
         if not instances:
             return params
         serializer = serializer or self.serdes.serializer
-        serialized = [*params, *(serializer(i) for i in instances)]
+        # This must be materialized: the executors retry on transient errors,
+        #   and a retry can't re-consume a spent iterator.
+        serialized = [*params, *map(serializer, instances)]
         return serialized
 
 
 class StatementCursor(Statement[_T]):
     """The StatementCursor provides direct access to a query result cursor."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -221,21 +255,26 @@ class StatementCursor(Statement[_T]):
         middleware: types.MiddlewareMethodProtocolT = None,
         serdes: SerDes[_T] = None,
     ):
-        query = self._cursor_datum(query)
+        query = _cursor_datum(query)
         super().__init__(
             query=query, executor=executor, middleware=middleware, serdes=serdes
         )
 
-    @typic.fastcachedmethod
-    def _cursor_datum(self, query: parse.QueryDatum) -> parse.QueryDatum:
-        if query.name.endswith("_cursor"):
-            return query
-        return dataclasses.replace(query, name=query.name + "_cursor")
+
+@functools.lru_cache(maxsize=None)
+def _cursor_datum(query: parse.QueryDatum) -> parse.QueryDatum:
+    # QueryDatum is frozen, so every cursor statement for a query can share one.
+    if query.name.endswith("_cursor"):
+        return query
+    return dataclasses.replace(query, name=query.name + "_cursor")
 
 
 class Many(Statement[_T]):
     """Execute a query, returning all results as a list."""
 
+    __slots__ = ()
+    _EXECUTOR = "many"
+
     def execute(
         self,
         *args,
@@ -249,25 +288,29 @@ class Many(Statement[_T]):
         deserializer: types.DeserializerT | None = None,
         **kwargs,
     ):
-        sargs, skwargs = self._serialize_instance(
-            instance=instance, serializer=serializer, args=args, kwargs=kwargs
-        )
-        deserializer = deserializer or self.serdes.bulk_deserializer
-        return self.executor.many(
+        if instance is not None:
+            args, kwargs = self._serialize_instance(
+                instance=instance, serializer=serializer, args=args, kwargs=kwargs
+            )
+        deserializer = deserializer or self._deserializer
+        return self._exec(
             self.query,
-            *sargs,
+            *args,
             connection=connection,
             timeout=timeout,
             transaction=transaction,
             rollback=rollback,
             deserializer=deserializer if coerce else None,
-            **skwargs,
+            **kwargs,
         )
 
 
 class ManyCursor(StatementCursor):
     """Execute a query, returning all results as a cursor."""
 
+    __slots__ = ()
+    _EXECUTOR = "many_cursor"
+
     def execute(
         self,
         *args,
@@ -279,23 +322,27 @@ class ManyCursor(StatementCursor):
         serializer: types.SerializerT | None = None,
         **kwargs,
     ):
-        sargs, skwargs = self._serialize_instance(
-            instance=instance, serializer=serializer, args=args, kwargs=kwargs
-        )
-        return self.executor.many_cursor(
+        if instance is not None:
+            args, kwargs = self._serialize_instance(
+                instance=instance, serializer=serializer, args=args, kwargs=kwargs
+            )
+        return self._exec(
             self.query,
-            *sargs,
+            *args,
             connection=connection,
             timeout=timeout,
             transaction=transaction,
             rollback=rollback,
-            **skwargs,
+            **kwargs,
         )
 
 
 class Raw(Statement):
     """Execute a query, returning all results as a list, without deserialization."""
 
+    __slots__ = ()
+    _EXECUTOR = "raw"
+
     def execute(
         self,
         *args,
@@ -307,23 +354,27 @@ class Raw(Statement):
         serializer: types.SerializerT | None = None,
         **kwargs,
     ):
-        sargs, skwargs = self._serialize_instance(
-            instance=instance, serializer=serializer, args=args, kwargs=kwargs
-        )
-        return self.executor.raw(
+        if instance is not None:
+            args, kwargs = self._serialize_instance(
+                instance=instance, serializer=serializer, args=args, kwargs=kwargs
+            )
+        return self._exec(
             self.query,
-            *sargs,
+            *args,
             connection=connection,
             timeout=timeout,
             transaction=transaction,
             rollback=rollback,
-            **skwargs,
+            **kwargs,
         )
 
 
 class RawCursor(StatementCursor):
     """Execute a query, returning all results as a cursor."""
 
+    __slots__ = ()
+    _EXECUTOR = "raw_cursor"
+
     def execute(
         self,
         *args,
@@ -335,21 +386,26 @@ class RawCursor(StatementCursor):
         serializer: types.SerializerT | None = None,
         **kwargs,
     ):
-        sargs, skwargs = self._serialize_instance(
-            instance=instance, serializer=serializer, args=args, kwargs=kwargs
-        )
-        return self.executor.raw_cursor(
+        if instance is not None:
+            args, kwargs = self._serialize_instance(
+                instance=instance, serializer=serializer, args=args, kwargs=kwargs
+            )
+        return self._exec(
             self.query,
-            *sargs,
+            *args,
             connection=connection,
             timeout=timeout,
             transaction=transaction,
             rollback=rollback,
-            **skwargs,
+            **kwargs,
         )
 
 
 class One(Statement):
+    __slots__ = ()
+    _EXECUTOR = "one"
+    _DESERIALIZER = "deserializer"
+
     def execute(
         self,
         *args,
@@ -363,25 +419,29 @@ class One(Statement):
         deserializer: types.DeserializerT | None = None,
         **kwargs,
     ):
-        sargs, skwargs = self._serialize_instance(
-            instance=instance, serializer=serializer, args=args, kwargs=kwargs
-        )
-        deserializer = deserializer or self.serdes.deserializer
-        return self.executor.one(
+        if instance is not None:
+            args, kwargs = self._serialize_instance(
+                instance=instance, serializer=serializer, args=args, kwargs=kwargs
+            )
+        deserializer = deserializer or self._deserializer
+        return self._exec(
             self.query,
-            *sargs,
+            *args,
             connection=connection,
             timeout=timeout,
             transaction=transaction,
             rollback=rollback,
             deserializer=deserializer if coerce else None,
-            **skwargs,
+            **kwargs,
         )
 
 
 class Scalar(Statement):
     """Execute a query, returning a single value from the first result."""
 
+    __slots__ = ()
+    _EXECUTOR = "scalar"
+
     def execute(
         self,
         *args,
@@ -393,23 +453,27 @@ class Scalar(Statement):
         serializer: types.SerializerT | None = None,
         **kwargs,
     ):
-        sargs, skwargs = self._serialize_instance(
-            instance=instance, serializer=serializer, args=args, kwargs=kwargs
-        )
-        return self.executor.scalar(
+        if instance is not None:
+            args, kwargs = self._serialize_instance(
+                instance=instance, serializer=serializer, args=args, kwargs=kwargs
+            )
+        return self._exec(
             self.query,
-            *sargs,
+            *args,
             connection=connection,
             timeout=timeout,
             transaction=transaction,
             rollback=rollback,
-            **skwargs,
+            **kwargs,
         )
 
 
 class Multi(Statement):
     """Execute a query with multiple sets of parameters, returning all results."""
 
+    __slots__ = ()
+    _EXECUTOR = "multi"
+
     def execute(  # type: ignore[override]
         self,
         *,
@@ -427,8 +491,8 @@ class Multi(Statement):
         params = self._serialize_instances(
             instances=instances, params=params, serializer=serializer
         )
-        deserializer = deserializer or self.serdes.bulk_deserializer
-        return self.executor.multi(
+        deserializer = deserializer or self._deserializer
+        return self._exec(
             self.query,
             params=params,
             connection=connection,
@@ -443,6 +507,9 @@ class Multi(Statement):
 class MultiCursor(StatementCursor):
     """Execute a query with multiple sets of parameters, returning a cursor."""
 
+    __slots__ = ()
+    _EXECUTOR = "multi_cursor"
+
     def execute(  # type: ignore[override]
         self,
         *,
@@ -458,7 +525,7 @@ class MultiCursor(StatementCursor):
         params = self._serialize_instances(
             instances=instances, params=params, serializer=serializer
         )
-        return self.executor.multi_cursor(
+        return self._exec(
             self.query,
             params=params,
             connection=connection,
@@ -469,6 +536,9 @@ class MultiCursor(StatementCursor):
 
 
 class Affected(Statement):
+    __slots__ = ()
+    _EXECUTOR = "affected"
+
     def execute(
         self,
         *args,
@@ -480,20 +550,18 @@ class Affected(Statement):
         serializer: types.SerializerT | None = None,
         **kwargs,
     ):
-        sargs, skwargs = self._serialize_instance(
-            instance=instance,
-            serializer=serializer,
-            args=args,
-            kwargs=kwargs,
-        )
-        return self.executor.affected(
+        if instance is not None:
+            args, kwargs = self._serialize_instance(
+                instance=instance, serializer=serializer, args=args, kwargs=kwargs
+            )
+        return self._exec(
             self.query,
-            *sargs,
+            *args,
             connection=connection,
             timeout=timeout,
             transaction=transaction,
             rollback=rollback,
-            **skwargs,
+            **kwargs,
         )
 
 
@@ -538,11 +606,14 @@ StatementsT = Union[
     RawCursor,
     Scalar,
 ]
-_MODIFIER_TO_STATEMENTS: dict[parse.ModifierT, list[type[StatementsT]]] = {
-    parse.AFFECTED: [Affected],
-    parse.MANY: [Many, ManyCursor],
-    parse.MULTI: [Multi, MultiCursor],
-    parse.ONE: [One],
-    parse.RAW: [Raw, RawCursor],
-    parse.SCALAR: [Scalar],
+# Each modifier has a statement, and optionally a cursor statement.
+_MODIFIER_TO_STATEMENTS: dict[
+    parse.ModifierT, tuple[type[StatementsT], type[StatementsT] | None]
+] = {
+    parse.AFFECTED: (Affected, None),
+    parse.MANY: (Many, ManyCursor),
+    parse.MULTI: (Multi, MultiCursor),
+    parse.ONE: (One, None),
+    parse.RAW: (Raw, RawCursor),
+    parse.SCALAR: (Scalar, None),
 }
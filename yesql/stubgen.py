@@ -1,18 +1,20 @@
 from __future__ import annotations
 
+import ast
+import functools
 import importlib
 import inspect
 import pathlib
-import string
 import sys
 import textwrap
 from types import ModuleType
-from typing import TypedDict
+from typing import TYPE_CHECKING, Callable, Mapping, TypedDict
 
-import black
 from yesql.core.parse import QueryDatum
 from yesql.repository import BaseQueryRepository
-from yesql.statement import Statement
+
+if TYPE_CHECKING:
+    from yesql.statement import Statement
 
 
 def stubgen(module: str | ModuleType) -> pathlib.Path | None:
@@ -44,40 +46,84 @@ def get_stub_module(module: ModuleType) -> str | None:
         module_def = inspect.getsource(module)
     except OSError:
         return None
-    replacements: list[tuple[str, str]] = []
+    # The offset at which to insert each repository's stub methods.
+    insertions: list[tuple[int, str]] = []
     repos: list[tuple[str, type[BaseQueryRepository]]] = inspect.getmembers(
         module, is_repository
     )
     if not repos:
         return None
 
+    # Locate every class in the module with one parse, rather than having
+    #   `inspect.getsource` re-read and re-parse the module for each repository.
+    class_defs = get_class_sources(module_def)
     for name, repo in repos:
-        try:
-            class_def = inspect.getsource(repo)
-        except (OSError, TypeError):
+        class_def = class_defs.get(repo.__qualname__)
+        if repo.__module__ != module.__name__ or class_def is None:
             # TODO
             continue
 
+        start = module_def.find(class_def)
+        if start == -1:
+            continue
         methods: list[str] = get_stub_methods(repo)
         method_body = "".join(methods)
-        class_def_stub = class_def + textwrap.indent(method_body, "    ")
-        replacements.append((class_def, class_def_stub))
+        insertions.append(
+            (start + len(class_def), textwrap.indent(method_body, "    "))
+        )
 
-    module_def_stub = "import typing\n" + module_def
-    for src, replacement in replacements:
-        module_def_stub = module_def_stub.replace(src, replacement)
+    # Splice the stub methods in with a single pass over the module source.
+    parts = ["import typing\n"]
+    pos = 0
+    for end, method_body in sorted(insertions):
+        parts.extend((module_def[pos:end], method_body))
+        pos = end
+    parts.append(module_def[pos:])
+    module_def_stub = "".join(parts)
 
     module_def_stub_blackened = blacken(module_def_stub)
     return module_def_stub_blackened
 
 
+def get_class_sources(module_def: str) -> dict[str, str]:
+    finder = _ClassSourceFinder(module_def.splitlines(keepends=True))
+    finder.visit(ast.parse(module_def))
+    return finder.sources
+
+
+class _ClassSourceFinder(ast.NodeVisitor):
+    # Mirrors the search `inspect.getsource` does for a single class.
+
+    def __init__(self, lines: list[str]):
+        self.lines = lines
+        self.stack: list[str] = []
+        self.sources: dict[str, str] = {}
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef):
+        self.stack.extend((node.name, "<locals>"))
+        self.generic_visit(node)
+        del self.stack[-2:]
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self.stack.append(node.name)
+        start = node.decorator_list[0].lineno if node.decorator_list else node.lineno
+        source = "".join(inspect.getblock(self.lines[start - 1 :]))
+        self.sources.setdefault(".".join(self.stack), source)
+        self.generic_visit(node)
+        self.stack.pop()
+
+
 def get_stub_methods(repo: type[BaseQueryRepository]) -> list[str]:
     methods: list[str] = []
+    modelname, isaio = repo.model.__name__, repo.isaio
+    annotations = get_param_annotations(modelname)
     for method_name, statement in repo.__statements__.items():
         default_return, raw_return = get_return_types(
-            modelname=repo.model.__name__, query=statement.query, isaio=repo.isaio
+            modelname=modelname, query=statement.query, isaio=isaio
         )
-        instance_params = get_instance_params(statement, repo)
+        instance_params = get_instance_params(statement, annotations)
         query_params = get_query_params(statement, instance_params)
         instance_sigs = get_signatures(
             *instance_params.values(),
@@ -91,12 +137,12 @@ def get_stub_methods(repo: type[BaseQueryRepository]) -> list[str]:
             raw_returns=raw_return,
             name=statement.query.name,
         )
-        istr = method_template.substitute(
+        istr = render_method(
             method_name=method_name,
             doc=statement.query.doc,
             **instance_sigs,
         )
-        qstr = method_template.substitute(
+        qstr = render_method(
             method_name=method_name, doc=statement.query.doc, **query_sigs
         )
         methods.extend((istr, qstr))
@@ -149,38 +195,65 @@ def get_signatures(
 
 
 def get_instance_params(
-    statement: Statement, repo: type[BaseQueryRepository]
+    statement: Statement, annotations: Mapping[str, str]
 ) -> dict[str, inspect.Parameter]:
-    unprocessed = inspect.signature(statement.execute).parameters
+    unprocessed = get_execute_params(type(statement).execute)
     processed = {}
     for name, param in unprocessed.items():
-        if name in ("coerce", "args", "kwargs", "_"):
+        if name in _IGNORED_PARAMS:
             continue
-        annotation = param.annotation
-        if name == "instance":
-            annotation = f"{repo.model.__name__} | None"
-        elif name == "instances":
-            annotation = f"typing.Sequence[{repo.model.__name__}]"
-        elif name == "params":
-            annotation = (
-                "typing.Iterable[typing.Sequence | typing.Mapping[str, typing.Any]]"
-            )
-        elif name in ("connection", "serializer", "deserializer"):
+        annotation = annotations.get(name, param.annotation)
+        if name in _DRIVER_PARAMS:
             annotation = "yesql.types." + param.annotation.rsplit(".")[-1]
-        processed[name] = param.replace(annotation=annotation)
+        # Parameters are immutable, so only build a new one if we need to.
+        if annotation != param.annotation:
+            param = param.replace(annotation=annotation)
+        processed[name] = param
     return processed
 
 
+def get_param_annotations(modelname: str) -> dict[str, str]:
+    # Build these once per repository, not once per statement.
+    return {
+        **_PARAM_ANNOTATIONS,
+        "instance": f"{modelname} | None",
+        "instances": f"typing.Sequence[{modelname}]",
+    }
+
+
+_IGNORED_PARAMS = frozenset(("coerce", "args", "kwargs", "_"))
+_DRIVER_PARAMS = frozenset(("connection", "serializer", "deserializer"))
+_PARAM_ANNOTATIONS = {
+    "params": "typing.Iterable[typing.Sequence | typing.Mapping[str, typing.Any]]",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_execute_params(execute: Callable) -> Mapping[str, inspect.Parameter]:
+    # There are only a handful of statement types, so only inspect each once.
+    #   This is the plain function, so drop `self` as binding would.
+    _, *params = inspect.signature(execute).parameters.values()
+    return {p.name: p for p in params}
+
+
 def get_query_params(
     statement: Statement, instance_params: dict[str, inspect.Parameter]
 ):
-    query_params = {**statement.query.signature.parameters, **instance_params}
-    query_params.pop("instance", None)
-    query_params.pop("instances", None)
+    query_params = dict(statement.query.signature.parameters)
+    query_params.update(instance_params)
+    for name in _INSTANCE_PARAMS:
+        query_params.pop(name, None)
     return query_params
 
 
+_INSTANCE_PARAMS = ("instance", "instances")
+
+
 def blacken(code: str) -> str:
+    # black is by far the heaviest import here, and it's only needed once we have
+    #   a stub to format, so don't pay for it on import (e.g., `yesql --help`).
+    import black
+
     pyver = sys.version_info.minor
     black_pyver = black.TargetVersion(pyver)
     black_mode = black.Mode(is_pyi=True, target_versions={black_pyver})
@@ -203,20 +276,26 @@ coerce_true = inspect.Parameter(
 self_param = inspect.Parameter("self", kind=inspect.Parameter.POSITIONAL_ONLY)
 
 
-method_template_str = '''
+def render_method(
+    method_name: str,
+    doc: str,
+    method_sig: inspect.Signature,
+    method_sig_coerce: inspect.Signature,
+    method_sig_no_coerce: inspect.Signature,
+) -> str:
+    return f'''
 @typing.overload
-def ${method_name}${method_sig}:
-    """${doc}
+def {method_name}{method_sig}:
+    """{doc}
     """
 
 @typing.overload
-def ${method_name}${method_sig_coerce}:
-    """${doc}
+def {method_name}{method_sig_coerce}:
+    """{doc}
     """
 
 @typing.overload
-def ${method_name}${method_sig_no_coerce}:
-    """${doc}
+def {method_name}{method_sig_no_coerce}:
+    """{doc}
     """
 '''
-method_template = string.Template(method_template_str)